@@ -2,28 +2,14 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import sys
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import structlog
-from dotenv import load_dotenv
-
-from polymarket_monitor_engine.adapters.clob_ws import ClobWebSocketFeed
-from polymarket_monitor_engine.adapters.discord_sink import DiscordWebhookSink
-from polymarket_monitor_engine.adapters.gamma_http import GammaHttpCatalog
-from polymarket_monitor_engine.adapters.multiplex_sink import MultiplexEventSink
-from polymarket_monitor_engine.adapters.redis_sink import RedisPubSubSink
-from polymarket_monitor_engine.adapters.stdout_sink import StdoutSink
-from polymarket_monitor_engine.application.component import PolymarketComponent
-from polymarket_monitor_engine.application.dashboard import TerminalDashboard
-from polymarket_monitor_engine.application.discovery import MarketDiscovery
-from polymarket_monitor_engine.application.monitor import SignalDetector
-from polymarket_monitor_engine.config import Settings, load_settings
-from polymarket_monitor_engine.util.clock import SystemClock
-from polymarket_monitor_engine.util.httpx_setup import silence_httpx_logs
-from polymarket_monitor_engine.util.logging_setup import configure_logging
-
-logger = structlog.get_logger(__name__)
+if TYPE_CHECKING:
+    from polymarket_monitor_engine.application.component import PolymarketComponent
+    from polymarket_monitor_engine.config import Settings
 
 
 def _default_config_path() -> Path | None:
@@ -34,10 +20,24 @@ def _default_config_path() -> Path | None:
 
 
 def build_component(settings: Settings) -> PolymarketComponent:
+    # Adapters pull in httpx/websockets/redis; import them only once we actually build.
+    from polymarket_monitor_engine.adapters.clob_ws import ClobWebSocketFeed
+    from polymarket_monitor_engine.adapters.discord_sink import DiscordWebhookSink
+    from polymarket_monitor_engine.adapters.gamma_http import GammaHttpCatalog
+    from polymarket_monitor_engine.adapters.multiplex_sink import MultiplexEventSink
+    from polymarket_monitor_engine.adapters.redis_sink import RedisPubSubSink
+    from polymarket_monitor_engine.adapters.stdout_sink import StdoutSink
+    from polymarket_monitor_engine.application.component import PolymarketComponent
+    from polymarket_monitor_engine.application.dashboard import TerminalDashboard
+    from polymarket_monitor_engine.application.discovery import MarketDiscovery
+    from polymarket_monitor_engine.application.monitor import SignalDetector
+    from polymarket_monitor_engine.util.clock import SystemClock
+
     catalog = GammaHttpCatalog(
         base_url=settings.gamma.base_url,
         timeout_sec=settings.gamma.timeout_sec,
         page_size=settings.gamma.page_size,
+        page_concurrency=settings.gamma.page_concurrency,
         use_events_endpoint=settings.gamma.use_events_endpoint,
         events_limit_per_category=settings.gamma.events_limit_per_category,
         events_sort_primary=settings.gamma.events_sort_primary,
@@ -46,6 +46,8 @@ def build_component(settings: Settings) -> PolymarketComponent:
         related_tags=settings.gamma.related_tags,
         request_interval_ms=settings.gamma.request_interval_ms,
         tags_cache_sec=settings.gamma.tags_cache_sec,
+        tags_redis_url=settings.gamma.tags_redis_url,
+        markets_cache_sec=settings.gamma.markets_cache_sec,
         retry_max_attempts=settings.gamma.retry_max_attempts,
     )
 
@@ -56,6 +58,8 @@ def build_component(settings: Settings) -> PolymarketComponent:
         initial_dump=settings.clob.initial_dump,
         max_frame_bytes=settings.clob.max_frame_bytes,
         max_message_bytes=settings.clob.max_message_bytes,
+        recv_queue_size=settings.clob.recv_queue_size,
+        compression=settings.clob.compression,
         ping_interval_sec=settings.clob.ping_interval_sec,
         ping_message=settings.clob.ping_message,
         pong_message=settings.clob.pong_message,
@@ -80,6 +84,7 @@ def build_component(settings: Settings) -> PolymarketComponent:
             aggregate_max_items=settings.sinks.discord.aggregate_max_items,
             log_payloads=settings.sinks.discord.log_payloads,
             log_payloads_path=settings.sinks.discord.log_payloads_path,
+            batch_window_sec=settings.sinks.discord.batch_window_sec,
         )
 
     sink = MultiplexEventSink(
@@ -156,7 +161,18 @@ def build_component(settings: Settings) -> PolymarketComponent:
     )
 
 
-def parse_args() -> argparse.Namespace:
+async def _run(component: PolymarketComponent) -> None:
+    from polymarket_monitor_engine.adapters.discord_sink import aclose_shared_client
+    from polymarket_monitor_engine.adapters.gamma_http import aclose_shared_clients
+
+    try:
+        await component.run()
+    finally:
+        await aclose_shared_client()
+        await aclose_shared_clients()
+
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Polymarket monitor engine")
     parser.add_argument(
         "--config",
@@ -169,12 +185,29 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Enable live terminal dashboard",
     )
-    return parser.parse_args()
+    return parser
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    args = sys.argv[1:] if argv is None else argv
+    # Fast path: the common "no flags" start never needs a parser; --help goes through it.
+    if not args:
+        return argparse.Namespace(config=_default_config_path(), dashboard=False)
+    return _build_parser().parse_args(args)
 
 
 def main() -> None:
-    load_dotenv()
     args = parse_args()
+
+    import structlog
+    from dotenv import load_dotenv
+
+    from polymarket_monitor_engine.config import load_settings
+    from polymarket_monitor_engine.util.httpx_setup import silence_httpx_logs
+    from polymarket_monitor_engine.util.logging_setup import configure_logging
+
+    logger = structlog.get_logger(__name__)
+    load_dotenv()
     settings = load_settings(args.config)
     if args.dashboard:
         settings.dashboard.enabled = True
@@ -193,9 +226,9 @@ def main() -> None:
         try:
             import uvloop
 
-            uvloop.run(component.run())
+            uvloop.run(_run(component))
         except ImportError:
-            asyncio.run(component.run())
+            asyncio.run(_run(component))
     except KeyboardInterrupt:
         logger.info("component_shutdown")
     finally:
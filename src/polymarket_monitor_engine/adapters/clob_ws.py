@@ -3,7 +3,8 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import json
-from collections.abc import AsyncIterator
+import sys
+from collections.abc import AsyncIterator, Iterable, Iterator
 
 import orjson
 import structlog
@@ -14,6 +15,25 @@ from polymarket_monitor_engine.ports.feed import FeedMessage, normalize_message
 
 logger = structlog.get_logger(__name__)
 
+_KIND_BY_HINT: dict[str, str] = {
+    "last_trade_price": "trade",
+    "trade": "trade",
+    "last_trade": "trade",
+    "fill": "trade",
+    "book": "book",
+    "orderbook": "book",
+    "price_change": "price_change",
+    "best_bid_ask": "best_bid_ask",
+    "new_market": "market_lifecycle",
+    "market_resolved": "market_lifecycle",
+    "ping": "ping",
+    "pong": "pong",
+}
+_CONTROL_KINDS = frozenset({"ping", "pong"})
+_CONTROL_FRAME_MAX_LEN = 16
+_JSON_FRAME_STARTS = frozenset({"{", "[", b"{", b"["})
+_STREAM_END = object()
+
 
 class ClobWebSocketFeed:
     def __init__(
@@ -29,45 +49,84 @@ class ClobWebSocketFeed:
         reconnect_max_sec: int,
         max_frame_bytes: int = 1_000_000,
         max_message_bytes: int | None = 2_000_000,
+        recv_queue_size: int = 1024,
+        compression: str | None = None,
     ) -> None:
         self._ws_url = ws_url
         self._channel = channel
+        self._resolved_ws_url = self._resolve_ws_url(ws_url, channel)
         self._custom_feature_enabled = custom_feature_enabled
         self._initial_dump = initial_dump
         self._ping_interval_sec = ping_interval_sec
-        self._ping_message = ping_message
-        self._pong_message = pong_message
+        self._ping_bytes = ping_message.encode("utf-8")
+        self._pong_bytes = pong_message.encode("utf-8")
+        self._subscribe_base_payload = {
+            "type": channel,
+            "custom_feature_enabled": custom_feature_enabled,
+            "initial_dump": initial_dump,
+        }
         self._reconnect_backoff_sec = reconnect_backoff_sec
         self._reconnect_max_sec = reconnect_max_sec
         self._max_frame_bytes = max_frame_bytes
         self._max_message_bytes = max_message_bytes
+        self._recv_queue_size = max(1, int(recv_queue_size))
+        self._compression = compression or None
         self._ws: websockets.WebSocketClientProtocol | None = None
         self._stop = asyncio.Event()
         self._desired_ids: set[str] = set()
         self._subscribed_ids: set[str] = set()
         self._ping_task: asyncio.Task[None] | None = None
+        self._pong_pending = False
 
     async def connect(self) -> None:
         if self._is_closed():
             self._ws = await websockets.connect(
-                self._resolve_ws_url(),
+                self._resolved_ws_url,
                 ping_interval=None,
                 max_size=self._max_message_bytes,
+                compression=self._compression,
             )
             self._subscribed_ids.clear()
-            logger.info("clob_connected", ws_url=self._resolve_ws_url())
+            logger.info("clob_connected", ws_url=self._resolved_ws_url)
 
     async def subscribe(self, token_ids: list[str]) -> None:
-        self._desired_ids = set(token_ids)
+        self._desired_ids = {sys.intern(token_id) for token_id in token_ids}
         if self._is_closed():
             return
         await self._apply_subscription_changes()
 
+    async def add_tokens(self, token_ids: Iterable[str]) -> None:
+        added = [
+            sys.intern(token_id) for token_id in token_ids if token_id not in self._desired_ids
+        ]
+        if not added:
+            return
+        self._desired_ids.update(added)
+        if self._is_closed():
+            return
+        if not self._subscribed_ids:
+            await self._apply_subscription_changes()
+            return
+        await self._send_operation("subscribe", added)
+        self._subscribed_ids.update(added)
+
+    async def remove_tokens(self, token_ids: Iterable[str]) -> None:
+        removed = [token_id for token_id in token_ids if token_id in self._desired_ids]
+        if not removed:
+            return
+        self._desired_ids.difference_update(removed)
+        if self._is_closed():
+            return
+        removed = [token_id for token_id in removed if token_id in self._subscribed_ids]
+        if removed:
+            await self._send_operation("unsubscribe", removed)
+            self._subscribed_ids.difference_update(removed)
+
     async def resubscribe(self, token_ids: list[str]) -> None:
-        self._desired_ids = set(token_ids)
+        self._desired_ids = {sys.intern(token_id) for token_id in token_ids}
         if self._is_closed():
             return
-        await self._send_initial_subscription(sorted(self._desired_ids))
+        await self._send_initial_subscription(list(self._desired_ids))
         self._subscribed_ids = set(self._desired_ids)
 
     async def messages(self) -> AsyncIterator[FeedMessage]:
@@ -82,33 +141,28 @@ class ClobWebSocketFeed:
                 self._start_ping_task()
 
                 assert self._ws is not None
-                async for raw in self._ws:
-                    if self._handle_ping(raw):
-                        continue
-                    try:
-                        payload = self._decode(raw)
-                    except json.JSONDecodeError:
-                        logger.warning("clob_decode_failed")
-                        continue
-                    if isinstance(payload, list):
-                        for item in payload:
-                            if not isinstance(item, dict):
-                                continue
-                            if self._handle_ping_payload(item):
-                                continue
-                            kind = self._detect_kind(item)
-                            message = normalize_message(kind, item)
-                            if message is not None:
+                queue: asyncio.Queue[object] = asyncio.Queue(maxsize=self._recv_queue_size)
+                reader = asyncio.create_task(self._pump_frames(self._ws, queue))
+                try:
+                    stream_open = True
+                    while stream_open:
+                        batch = [await queue.get()]
+                        while not queue.empty():
+                            batch.append(queue.get_nowait())
+                        for raw in batch:
+                            if raw is _STREAM_END:
+                                stream_open = False
+                                break
+                            if isinstance(raw, BaseException):
+                                raise raw
+                            for message in self._frame_messages(raw):
                                 yield message
-                        continue
-                    if not isinstance(payload, dict):
-                        continue
-                    if self._handle_ping_payload(payload):
-                        continue
-                    kind = self._detect_kind(payload)
-                    message = normalize_message(kind, payload)
-                    if message is not None:
-                        yield message
+                            if self._pong_pending:
+                                await self._send_pong()
+                finally:
+                    reader.cancel()
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await reader
 
                 backoff = self._reconnect_backoff_sec
             except Exception as exc:  # noqa: BLE001
@@ -124,6 +178,51 @@ class ClobWebSocketFeed:
             await self._ws.close()
             self._ws = None
 
+    @staticmethod
+    async def _pump_frames(
+        ws: websockets.WebSocketClientProtocol,
+        queue: asyncio.Queue[object],
+    ) -> None:
+        try:
+            async for raw in ws:
+                await queue.put(raw)
+        except Exception as exc:  # noqa: BLE001
+            await queue.put(exc)
+            return
+        await queue.put(_STREAM_END)
+
+    def _frame_messages(self, raw: str | bytes | bytearray | memoryview) -> Iterator[FeedMessage]:
+        if type(raw) is not str and type(raw) is not bytes:
+            # Slicing a bytearray/memoryview doesn't yield bytes, so normalise once up front.
+            raw = bytes(raw)
+        if self._handle_ping(raw):
+            return
+        try:
+            payload = self._decode(raw)
+        except json.JSONDecodeError:
+            logger.warning("clob_decode_failed")
+            return
+        # Decoders only ever produce plain dict/list, so exact type checks are safe here.
+        payload_type = type(payload)
+        if payload_type is dict:
+            items = (payload,)
+        elif payload_type is list:
+            items = payload
+        else:
+            return
+        classify = self._classify
+        normalize = normalize_message
+        for item in items:
+            if type(item) is not dict:
+                continue
+            kind = classify(item)
+            if kind in _CONTROL_KINDS:
+                self._handle_control(kind)
+                continue
+            message = normalize(kind, item)
+            if message is not None:
+                yield message
+
     async def _ensure_subscription(self) -> None:
         if not self._desired_ids:
             return
@@ -134,12 +233,12 @@ class ClobWebSocketFeed:
             return
 
         if initial or not self._subscribed_ids:
-            await self._send_initial_subscription(sorted(self._desired_ids))
+            await self._send_initial_subscription(list(self._desired_ids))
             self._subscribed_ids = set(self._desired_ids)
             return
 
-        to_add = sorted(self._desired_ids - self._subscribed_ids)
-        to_remove = sorted(self._subscribed_ids - self._desired_ids)
+        to_add = list(self._desired_ids - self._subscribed_ids)
+        to_remove = list(self._subscribed_ids - self._desired_ids)
 
         if to_add:
             await self._send_operation("subscribe", to_add)
@@ -151,12 +250,7 @@ class ClobWebSocketFeed:
     async def _send_initial_subscription(self, token_ids: list[str]) -> None:
         if not token_ids:
             return
-        base_payload = {
-            "type": self._channel,
-            "custom_feature_enabled": self._custom_feature_enabled,
-            "initial_dump": self._initial_dump,
-        }
-        batches = self._build_payload_batches(base_payload, token_ids)
+        batches = self._build_payload_batches(self._subscribe_base_payload, token_ids)
         for idx, (batch_ids, payload_bytes) in enumerate(batches, start=1):
             await self._send_bytes(payload_bytes)
             logger.info(
@@ -200,53 +294,39 @@ class ClobWebSocketFeed:
             return []
         batches: list[tuple[list[str], bytes]] = []
         max_bytes = self._max_frame_bytes
+        # orjson output is compact, so a frame's size is the empty frame plus each quoted id
+        # and its separating comma; serialize once per batch instead of once per token.
+        empty_size = len(orjson.dumps({**base_payload, "assets_ids": []}))
         current: list[str] = []
-        current_bytes: bytes | None = None
-
-        for token_id in token_ids:
-            candidate = [*current, token_id]
-            candidate_bytes = orjson.dumps({**base_payload, "assets_ids": candidate})
-            if len(candidate_bytes) <= max_bytes:
-                current = candidate
-                current_bytes = candidate_bytes
-                continue
-
-            if current:
-                batches.append(
-                    (
-                        list(current),
-                        current_bytes or orjson.dumps({**base_payload, "assets_ids": current}),
-                    )
+        current_size = empty_size
+
+        def flush() -> None:
+            payload_bytes = orjson.dumps({**base_payload, "assets_ids": current})
+            if len(payload_bytes) > max_bytes:
+                logger.warning(
+                    "clob_payload_too_large",
+                    bytes=len(payload_bytes),
+                    max_bytes=max_bytes,
                 )
-                current = [token_id]
-                current_bytes = orjson.dumps({**base_payload, "assets_ids": current})
-                if len(current_bytes) > max_bytes:
-                    logger.warning(
-                        "clob_payload_too_large",
-                        bytes=len(current_bytes),
-                        max_bytes=max_bytes,
-                    )
-                    batches.append((list(current), current_bytes))
-                    current = []
-                    current_bytes = None
-                continue
+            batches.append((list(current), payload_bytes))
 
-            logger.warning(
-                "clob_payload_too_large",
-                bytes=len(candidate_bytes),
-                max_bytes=max_bytes,
-            )
-            batches.append((list(candidate), candidate_bytes))
-            current = []
-            current_bytes = None
+        for token_id in token_ids:
+            token_size = len(orjson.dumps(token_id))
+            added_size = token_size + 1 if current else token_size
+            if current and current_size + added_size > max_bytes:
+                flush()
+                current = []
+                current_size = empty_size
+                added_size = token_size
+            current.append(token_id)
+            current_size += added_size
+            if current_size > max_bytes:
+                flush()
+                current = []
+                current_size = empty_size
 
         if current:
-            batches.append(
-                (
-                    list(current),
-                    current_bytes or orjson.dumps({**base_payload, "assets_ids": current}),
-                )
-            )
+            flush()
 
         return batches
 
@@ -269,61 +349,59 @@ class ClobWebSocketFeed:
             if self._is_closed():
                 await asyncio.sleep(self._ping_interval_sec)
                 continue
-            await self._ws.send(self._ping_message)
+            await self._ws.send(self._ping_bytes, text=True)
             await asyncio.sleep(self._ping_interval_sec)
 
     def _handle_ping(self, raw: str | bytes) -> bool:
+        # Data frames are JSON objects/arrays; only tiny bare-text frames can be ping/pong.
+        if len(raw) > _CONTROL_FRAME_MAX_LEN or raw[:1] in _JSON_FRAME_STARTS:
+            return False
         text = raw.decode("utf-8", errors="ignore") if isinstance(raw, bytes) else raw
-        if text.strip().lower() not in {"ping", "pong"}:
+        kind = text.strip().lower()
+        if kind not in _CONTROL_KINDS:
             return False
-        if self._is_closed():
-            return True
-        if text.strip().lower() == "ping":
-            asyncio.create_task(self._ws.send(self._pong_message))
+        self._handle_control(kind)
         return True
 
-    def _handle_ping_payload(self, payload: dict) -> bool:
-        hint = str(payload.get("type") or payload.get("event_type") or "").lower()
-        if hint not in {"ping", "pong"}:
-            return False
+    def _handle_control(self, kind: str) -> None:
+        if kind == "ping":
+            self._pong_pending = True
+
+    async def _send_pong(self) -> None:
+        self._pong_pending = False
         if self._is_closed():
-            return True
-        if hint == "ping":
-            asyncio.create_task(self._ws.send(self._pong_message))
-        return True
+            return
+        await self._ws.send(self._pong_bytes, text=True)
 
     def _is_closed(self) -> bool:
         if self._ws is None:
             return True
         return self._ws.state in {State.CLOSING, State.CLOSED}
 
-    def _resolve_ws_url(self) -> str:
-        if "/ws/" in self._ws_url:
-            return self._ws_url
-        return f"{self._ws_url.rstrip('/')}/ws/{self._channel}"
+    @staticmethod
+    def _resolve_ws_url(ws_url: str, channel: str) -> str:
+        if "/ws/" in ws_url:
+            return ws_url
+        return f"{ws_url.rstrip('/')}/ws/{channel}"
 
     @staticmethod
     def _decode(raw: str | bytes) -> dict:
-        if isinstance(raw, bytes):
+        if isinstance(raw, (bytes, bytearray)):
             return orjson.loads(raw)
         try:
-            return orjson.loads(raw.encode("utf-8"))
+            return orjson.loads(raw)
         except orjson.JSONDecodeError:
             return json.loads(raw)
 
     @staticmethod
-    def _detect_kind(payload: dict) -> str:
-        hint = str(payload.get("event_type") or payload.get("type") or "").lower()
-        if hint in {"last_trade_price", "trade", "last_trade", "fill"}:
-            return "trade"
-        if hint in {"book", "orderbook"}:
-            return "book"
-        if hint == "price_change":
-            return "price_change"
-        if hint == "best_bid_ask":
-            return "best_bid_ask"
-        if hint in {"new_market", "market_resolved"}:
-            return "market_lifecycle"
+    def _classify(payload: dict) -> str:
+        hint = payload.get("event_type") or payload.get("type")
+        if hint:
+            kind = _KIND_BY_HINT.get(hint) if isinstance(hint, str) else None
+            if kind is None:
+                kind = _KIND_BY_HINT.get(str(hint).lower())
+            if kind is not None:
+                return kind
         if "bids" in payload or "asks" in payload or "buys" in payload or "sells" in payload:
             return "book"
         return "raw"
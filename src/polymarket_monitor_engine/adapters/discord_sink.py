@@ -1,15 +1,24 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import contextlib
+import heapq
+import importlib.util
 import os
 import random
+import re
+import time
+from collections import deque
+from collections.abc import Callable
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import httpx
+import orjson
 import structlog
+from aiolimiter import AsyncLimiter
 from slugify import slugify
 
 from polymarket_monitor_engine.domain.events import DomainEvent, EventType
@@ -17,7 +26,6 @@ from polymarket_monitor_engine.domain.schemas.event_payloads import (
     BigTradePayload,
     HealthPayload,
     MajorChangePayload,
-    MarketLifecyclePayload,
     MonitoringStatusPayload,
     SignalType,
     VolumeSpikePayload,
@@ -26,6 +34,49 @@ from polymarket_monitor_engine.domain.schemas.event_payloads import (
 
 logger = structlog.get_logger(__name__)
 
+# Discord webhooks are a single origin, so a small keep-alive pool is plenty.
+_HTTP_LIMITS = httpx.Limits(max_connections=8, max_keepalive_connections=8, keepalive_expiry=90)
+_shared_client: httpx.AsyncClient | None = None
+# Discord allows ~5 requests per 2s per webhook; stay under it instead of reacting to 429s.
+_WEBHOOK_RATE_LIMIT = 5
+_WEBHOOK_RATE_PERIOD_SEC = 2.0
+# Per-webhook monotonic deadline set by 429/5xx so every sender backs off together.
+_cooldown_until: dict[str, float] = {}
+_COOLDOWN_JITTER_SEC = 0.5
+# Discord caps a webhook message at 10 embeds and 6000 embed characters in total.
+_MAX_EMBEDS_PER_POST = 10
+_MAX_EMBED_CHARS_PER_POST = 6000
+_JSON_HEADERS = {"Content-Type": "application/json"}
+# Aggregates bigger than this are built in a worker thread to keep the event loop free.
+_AGGREGATE_OFFLOAD_THRESHOLD = 16
+_AGGREGATABLE_SIGNALS = frozenset({"major_change", "big_trade", "volume_spike_1m"})
+_BINARY_SIDES = frozenset({"YES", "NO"})
+# Upper bound on events buffered across all aggregate keys while Discord is slow or down.
+_PENDING_HARD_CAP = 2000
+# Embeds waiting for the batching outbox; the oldest are dropped when Discord can't keep up.
+_OUTBOX_MAXSIZE = 10_000
+# ASCII titles without "&" take the regex path; the rest still go through slugify.
+_SLUG_NUMBER_COMMA_RE = re.compile(r"(?<=\d),(?=\d)")
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
+def _get_shared_client(timeout_sec: float) -> httpx.AsyncClient:
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            timeout=timeout_sec,
+            limits=_HTTP_LIMITS,
+            http2=importlib.util.find_spec("h2") is not None,
+        )
+    return _shared_client
+
+
+async def aclose_shared_client() -> None:
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+
 
 def _get_signal(event: DomainEvent) -> str | None:
     payload = event.payload
@@ -55,28 +106,51 @@ class DiscordWebhookSink:
         aggregate_max_items: int = 5,
         log_payloads: bool = True,
         log_payloads_path: str = "logs/discord.out.jsonl",
+        batch_window_sec: float = 0.5,
+        client: httpx.AsyncClient | None = None,
     ) -> None:
         webhook_url = os.getenv("DISCORD_WEBHOOK_URL", "").strip()
         self._webhook_url = webhook_url
+        self._url = httpx.URL(webhook_url) if webhook_url else None
+        # Host only: the webhook path carries the token.
+        self._log = logger.bind(
+            component="discord_sink",
+            webhook_host=self._url.host if self._url is not None else None,
+        )
         self._max_retries = max(0, int(max_retries))
         self._aggregate_multi_outcome = aggregate_multi_outcome
         self._aggregate_window_sec = max(0.2, float(aggregate_window_sec))
         self._aggregate_max_items = max(1, int(aggregate_max_items))
+        self._batch_window_sec = max(0.0, float(batch_window_sec))
+        self._outbox: asyncio.Queue[tuple[dict, dict[str, Any]]] = asyncio.Queue(
+            maxsize=_OUTBOX_MAXSIZE
+        )
+        self._outbox_task: asyncio.Task[None] | None = None
+        self._outbox_collecting: list[tuple[dict, dict[str, Any]]] = []
+        self._outbox_post: asyncio.Task[None] | None = None
+        # Outbox post failures not yet reported to a caller, and the last error seen.
+        self._failed_embeds = 0
+        self._last_error: BaseException | None = None
         self._log_payloads_enabled = bool(log_payloads)
         self._log_payloads_path = (log_payloads_path or "").strip()
         if self._log_payloads_enabled and not self._log_payloads_path:
-            logger.warning("discord_payload_log_failed", error="empty_path")
+            self._log.warning("discord_payload_log_failed", error="empty_path")
             self._log_payloads_enabled = False
         self._log_lock = asyncio.Lock()
-        self._pending: dict[tuple[str, str], list[DomainEvent]] = {}
+        self._pending: dict[tuple[str, str], deque[DomainEvent]] = {}
         self._pending_tasks: dict[tuple[str, str], asyncio.Task[None]] = {}
-        self._lock = asyncio.Lock()
+        self._pending_maxlen = self._aggregate_max_items * 4
+        self._pending_count = 0
+        self._dropped_events = 0
+        self._coalesced_events = 0
         self._client: httpx.AsyncClient | None = None
+        self._timeout = httpx.Timeout(timeout_sec)
         self._enabled = bool(webhook_url)
+        self._limiter = AsyncLimiter(_WEBHOOK_RATE_LIMIT, _WEBHOOK_RATE_PERIOD_SEC)
         if self._enabled:
-            self._client = httpx.AsyncClient(timeout=timeout_sec)
+            self._client = client or _get_shared_client(timeout_sec)
         else:
-            logger.warning("discord_webhook_missing")
+            self._log.warning("discord_webhook_missing")
 
     async def publish(self, event: DomainEvent) -> None:
         if not self._enabled or self._client is None:
@@ -85,69 +159,233 @@ class DiscordWebhookSink:
             return
         if self._should_aggregate(event):
             await self._enqueue(event)
-            return
-        payload = self._build_payload(event)
-        context = self._log_context_for_event(event)
-        await self._post_payload(payload, context=context)
+        else:
+            payload = self._build_payload(event)
+            context = self._log_context_for_event(event)
+            await self._deliver(payload, context)
+        # Outbox posts run in the background; surface their failures on the next publish so
+        # required-sink checks in MultiplexEventSink still see Discord outages.
+        self._raise_failure()
+
+    async def close(self) -> None:
+        pending = list(self._pending_tasks.values())
+        for task in pending:
+            task.cancel()
+        try:
+            # One failing aggregate flush must not stop the others or the outbox shutdown.
+            results = await asyncio.gather(
+                *(self._flush_pending(key) for key in list(self._pending)),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    self._failed_embeds += 1
+                    self._last_error = result
+                    self._log.warning("discord_flush_failed", error=str(result))
+        finally:
+            if self._outbox_task is not None:
+                self._outbox_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await self._outbox_task
+                self._outbox_task = None
+            if self._outbox_post is not None:
+                # A batch already handed to _post_batch finishes (including any backoff).
+                await self._outbox_post
+                self._outbox_post = None
+            await self._drain_outbox()
+        self._raise_failure()
 
     def _should_aggregate(self, event: DomainEvent) -> bool:
-        if not self._aggregate_multi_outcome:
-            return False
-        if event.event_type != EventType.TRADE_SIGNAL:
+        if not self._aggregate_multi_outcome or event.event_type is not EventType.TRADE_SIGNAL:
             return False
-        signal = _get_signal(event) or ""
-        if signal not in {"major_change", "big_trade", "volume_spike_1m"}:
+        side = event.side
+        if not side or not event.market_id or side.upper() in _BINARY_SIDES:
             return False
-        if not event.market_id or not event.side:
-            return False
-        side = event.side.upper()
-        return side not in {"YES", "NO"}
+        return _get_signal(event) in _AGGREGATABLE_SIGNALS
 
     async def _enqueue(self, event: DomainEvent) -> None:
+        # No await between the lookup and the insert, so the event loop keeps this atomic.
         key = (event.market_id or "n/a", str(_get_signal(event) or "signal"))
-        async with self._lock:
-            self._pending.setdefault(key, []).append(event)
-            if key not in self._pending_tasks:
-                self._pending_tasks[key] = asyncio.create_task(self._flush_after(key))
+        bucket = self._pending.get(key)
+        if bucket is None:
+            if self._pending_count >= _PENDING_HARD_CAP:
+                self._drop_oldest_key()
+            bucket = self._pending[key] = deque(maxlen=self._pending_maxlen)
+        if len(bucket) == bucket.maxlen:
+            self._dropped_events += 1
+        else:
+            self._pending_count += 1
+        bucket.append(event)
+        if key not in self._pending_tasks:
+            self._pending_tasks[key] = asyncio.create_task(self._flush_after(key))
+
+    def _drop_oldest_key(self) -> None:
+        key = next(iter(self._pending))
+        bucket = self._pending.pop(key)
+        self._pending_count -= len(bucket)
+        self._dropped_events += len(bucket)
+        task = self._pending_tasks.pop(key, None)
+        if task is not None:
+            task.cancel()
+        self._log.warning(
+            "discord_aggregate_dropped",
+            market_id=key[0],
+            signal=key[1],
+            dropped=len(bucket),
+            dropped_total=self._dropped_events,
+        )
+
+    @property
+    def pending_depth(self) -> int:
+        return self._pending_count
+
+    @property
+    def dropped_events(self) -> int:
+        return self._dropped_events
+
+    @property
+    def coalesced_events(self) -> int:
+        return self._coalesced_events
 
     async def _flush_after(self, key: tuple[str, str]) -> None:
         await asyncio.sleep(self._aggregate_window_sec)
-        async with self._lock:
-            events = self._pending.pop(key, [])
-            self._pending_tasks.pop(key, None)
+        await self._flush_pending(key)
+
+    async def _flush_pending(self, key: tuple[str, str]) -> None:
+        events = list(self._pending.pop(key, ()))
+        self._pending_tasks.pop(key, None)
+        self._pending_count -= len(events)
         if not events:
             return
-        payload = self._build_aggregate_payload(events)
+        if len(events) > _AGGREGATE_OFFLOAD_THRESHOLD:
+            payload = await asyncio.to_thread(self._build_aggregate_payload, events)
+        else:
+            payload = self._build_aggregate_payload(events)
         context = self._log_context_for_events(events)
-        await self._post_payload(payload, context=context)
+        await self._deliver(payload, context)
+
+    async def _deliver(self, payload: dict, context: dict[str, Any]) -> None:
+        embeds = payload.get("embeds")
+        if self._batch_window_sec <= 0 or not embeds:
+            await self._post_payload(payload, context=context)
+            return
+        for embed in embeds:
+            if self._outbox.full():
+                self._outbox.get_nowait()
+                self._dropped_events += 1
+                self._log.warning("discord_queue_dropped", dropped_total=self._dropped_events)
+            self._outbox.put_nowait((embed, context))
+        if self._outbox_task is None or self._outbox_task.done():
+            self._outbox_task = asyncio.create_task(self._run_outbox())
+
+    async def _run_outbox(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = self._outbox_collecting = [await self._outbox.get()]
+            deadline = loop.time() + self._batch_window_sec
+            while len(batch) < _MAX_EMBEDS_PER_POST:
+                if not self._outbox.empty():
+                    batch.append(self._outbox.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._outbox.get(), timeout))
+                except TimeoutError:
+                    break
+            self._outbox_collecting = []
+            # Shielded so close() can stop the loop without abandoning a post mid-request.
+            self._outbox_post = asyncio.create_task(self._post_batch(batch))
+            await asyncio.shield(self._outbox_post)
+            self._outbox_post = None
+
+    async def _drain_outbox(self) -> None:
+        batch = self._outbox_collecting
+        self._outbox_collecting = []
+        while not self._outbox.empty():
+            batch.append(self._outbox.get_nowait())
+        if batch:
+            await self._post_batch(batch)
+
+    async def _post_batch(self, batch: list[tuple[dict, dict[str, Any]]]) -> None:
+        if len(batch) > 1:
+            coalesced = _coalesce_batch(batch)
+            self._coalesced_events += len(batch) - len(coalesced)
+            batch = coalesced
+        for chunk in _pack_embeds(batch):
+            embeds = [embed for embed, _ in chunk]
+            contexts = [context for _, context in chunk]
+            context = (
+                contexts[0]
+                if len(contexts) == 1
+                else {"batch": True, "embed_count": len(embeds), "items": contexts}
+            )
+            try:
+                await self._post_payload({"embeds": embeds}, context=context)
+            except Exception as exc:  # noqa: BLE001
+                self._failed_embeds += len(embeds)
+                self._last_error = exc
+                self._log.warning("discord_batch_failed", error=str(exc), embed_count=len(embeds))
+
+    def _raise_failure(self) -> None:
+        if self._last_error is None:
+            return
+        error, failed = self._last_error, self._failed_embeds
+        self._last_error = None
+        self._failed_embeds = 0
+        raise RuntimeError(f"Discord webhook failed for {failed} embeds") from error
 
     async def _post_payload(self, payload: dict, context: dict[str, Any] | None = None) -> None:
         await self._log_payload(payload, context)
+        embed_chars = sum(_embed_chars(embed) for embed in payload.get("embeds") or ())
+        if embed_chars > _MAX_EMBED_CHARS_PER_POST:
+            self._log.warning("discord_payload_too_large", embed_chars=embed_chars)
+            raise RuntimeError("Discord webhook payload exceeds embed size limit")
+        await self._post_body(orjson.dumps(payload))
+
+    async def _post_body(self, body: bytes) -> None:
+        # Built once; the byte body replays unchanged on every retry.
+        request = self._client.build_request(
+            "POST",
+            self._url,
+            content=body,
+            headers=_JSON_HEADERS,
+            timeout=self._timeout,
+        )
         attempt = 0
+        delay = 0.0
         while True:
+            wait = _cooldown_until.get(self._webhook_url, 0.0) - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait + random.uniform(0, _COOLDOWN_JITTER_SEC))
             try:
-                resp = await self._client.post(self._webhook_url, json=payload)
+                await self._limiter.acquire()
+                resp = await self._client.send(request)
             except httpx.RequestError as exc:
                 if attempt >= self._max_retries:
-                    logger.warning("discord_post_failed", error_type=type(exc).__name__)
+                    self._log.warning("discord_post_failed", error_type=type(exc).__name__)
                     raise RuntimeError("Discord webhook request failed") from exc
-                await asyncio.sleep(_backoff_delay(attempt))
+                delay = _backoff_delay(delay)
+                await asyncio.sleep(delay)
                 attempt += 1
                 continue
 
             if resp.status_code == 429 or 500 <= resp.status_code < 600:
+                delay = _retry_after(resp) or _backoff_delay(delay)
+                deadline = time.monotonic() + delay
+                if deadline > _cooldown_until.get(self._webhook_url, 0.0):
+                    _cooldown_until[self._webhook_url] = deadline
                 if attempt >= self._max_retries:
-                    logger.warning("discord_post_failed", status=resp.status_code)
+                    self._log.warning("discord_post_failed", status=resp.status_code)
                     raise RuntimeError(f"Discord webhook HTTP {resp.status_code}")
-                delay = _retry_after(resp) or _backoff_delay(attempt)
-                await asyncio.sleep(delay)
                 attempt += 1
                 continue
 
             if 200 <= resp.status_code < 300:
                 return
 
-            logger.warning("discord_post_failed", status=resp.status_code)
+            self._log.warning("discord_post_failed", status=resp.status_code)
             raise RuntimeError(f"Discord webhook HTTP {resp.status_code}")
 
     @staticmethod
@@ -169,12 +407,12 @@ class DiscordWebhookSink:
         }
         if context:
             entry["context"] = context
-        line = json.dumps(entry, ensure_ascii=False)
+        line = orjson.dumps(entry).decode()
         try:
             async with self._log_lock:
                 await asyncio.to_thread(_append_log_line, self._log_payloads_path, line)
         except Exception as exc:  # noqa: BLE001
-            logger.warning(
+            self._log.warning(
                 "discord_payload_log_failed",
                 error=str(exc),
                 path=self._log_payloads_path,
@@ -199,6 +437,54 @@ class DiscordWebhookSink:
         return context
 
 
+def _coalesce_batch(
+    batch: list[tuple[dict, dict[str, Any]]],
+) -> list[tuple[dict, dict[str, Any]]]:
+    # Only exact repeats of one alert inside a window collapse to the latest; alerts for the
+    # same market + signal with different values all survive. The timestamp is ignored.
+    latest: dict[object, tuple[dict, dict[str, Any]]] = {}
+    for item in batch:
+        embed, context = item
+        market_id = context.get("market_id")
+        signal = context.get("signal")
+        key: object = id(item)
+        if market_id and signal:
+            content = {k: v for k, v in embed.items() if k != "timestamp"}
+            key = (market_id, signal, orjson.dumps(content, option=orjson.OPT_SORT_KEYS))
+        latest.pop(key, None)
+        latest[key] = item
+    return list(latest.values())
+
+
+def _pack_embeds(
+    batch: list[tuple[dict, dict[str, Any]]],
+) -> list[list[tuple[dict, dict[str, Any]]]]:
+    chunks: list[list[tuple[dict, dict[str, Any]]]] = []
+    current: list[tuple[dict, dict[str, Any]]] = []
+    current_chars = 0
+    for item in batch:
+        chars = _embed_chars(item[0])
+        if current and (
+            len(current) >= _MAX_EMBEDS_PER_POST
+            or current_chars + chars > _MAX_EMBED_CHARS_PER_POST
+        ):
+            chunks.append(current)
+            current = []
+            current_chars = 0
+        current.append(item)
+        current_chars += chars
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _embed_chars(embed: dict) -> int:
+    total = len(str(embed.get("title") or "")) + len(str(embed.get("description") or ""))
+    for field in embed.get("fields") or []:
+        total += len(str(field.get("name") or "")) + len(str(field.get("value") or ""))
+    return total
+
+
 def _append_log_line(path: str, line: str) -> None:
     target = Path(path)
     target.parent.mkdir(parents=True, exist_ok=True)
@@ -207,215 +493,208 @@ def _append_log_line(path: str, line: str) -> None:
 
 
 def _build_embed(event: DomainEvent) -> dict | None:
-    ts = datetime.fromtimestamp(event.ts_ms / 1000, tz=UTC)
+    builder = _EVENT_EMBED_BUILDERS.get(event.event_type)
+    if builder is None:
+        builder = _SIGNAL_EMBED_BUILDERS.get(_get_signal(event) or "signal", _embed_generic)
+    return builder(event)
+
+
+def _embed_labels(event: DomainEvent) -> tuple[str, str, str]:
     market = event.title or event.topic_key or "(unknown market)"
-    market_id = event.market_id or "n/a"
-    side = event.side
-    category = event.category or "n/a"
+    return market, event.market_id or "n/a", event.category or "n/a"
 
-    if event.event_type == EventType.MARKET_LIFECYCLE:
-        return None
 
-    if event.event_type == EventType.MONITORING_STATUS:
-        payload = event.payload if isinstance(event.payload, MonitoringStatusPayload) else None
-        status = payload.status if payload else event.metrics.get("status", "connected")
-        market_count = payload.market_count if payload else event.metrics.get("market_count")
-        event_count = payload.event_count if payload else event.metrics.get("event_count")
-        token_count = payload.token_count if payload else event.metrics.get("token_count")
-        unsub_count = (
-            payload.unsubscribable_count if payload else event.metrics.get("unsubscribable_count")
-        )
-        unsub_event_count = (
-            payload.unsubscribable_event_count
-            if payload
-            else event.metrics.get("unsubscribable_event_count")
-        )
+def _embed_timestamp(event: DomainEvent) -> str:
+    return _iso_from_ms(event.ts_ms)
 
-        raw = event.raw or {}
-        subscribed = raw.get("subscribed_markets") if isinstance(raw, dict) else None
-        unsub = raw.get("unsubscribable_markets") if isinstance(raw, dict) else None
-
-        subscribed_lines = _format_market_list(subscribed, limit=12)
-        unsub_lines = _format_market_list(unsub, limit=8)
-        category_counts = _format_category_counts(subscribed)
-
-        fields = [
-            {"name": "状态", "value": str(status), "inline": True},
-            {
-                "name": "统计",
-                "value": _format_monitoring_stats(
-                    event_count,
-                    market_count,
-                    token_count,
-                    unsub_event_count,
-                    unsub_count,
-                ),
-                "inline": True,
-            },
-            {"name": "分类统计", "value": category_counts, "inline": False},
-            {"name": "监控盘口", "value": subscribed_lines, "inline": False},
-            {"name": "灰盘（无 orderbook）", "value": unsub_lines, "inline": False},
-        ]
-        return {
-            "title": "🟢 已连接 | 监控启动",
-            "color": 0x2ECC71,
-            "fields": fields,
-            "timestamp": ts.isoformat(),
-        }
 
-    if event.event_type == EventType.HEALTH_EVENT:
-        payload = event.payload if isinstance(event.payload, HealthPayload) else None
-        status = payload.status if payload else event.metrics.get("status", "unknown")
-        duration = payload.duration_ms if payload else event.metrics.get("duration_ms")
-        color = 0x2ECC71 if status == "refresh_ok" else 0xE74C3C
-        fields = [{"name": "状态", "value": str(status), "inline": True}]
-        if duration is not None:
-            fields.append({"name": "耗时(ms)", "value": str(duration), "inline": True})
-        return {
-            "title": "🩺 健康检查",
-            "color": color,
-            "fields": fields,
-            "timestamp": ts.isoformat(),
-        }
+def _embed_market_lifecycle(event: DomainEvent) -> dict | None:
+    # Lifecycle changes are log-only; they never reach Discord.
+    return None
 
-    if event.event_type == EventType.MARKET_LIFECYCLE:
-        payload = event.payload if isinstance(event.payload, MarketLifecyclePayload) else None
-        status = str(payload.status if payload else event.metrics.get("status", "unknown"))
-        status_label = status
-        end_ts = payload.end_ts if payload else event.metrics.get("end_ts")
-        title = "🔁 盘口状态变更"
-        color = 0x3498DB
-        if status == "new":
-            title = "🆕 新盘口"
-            color = 0x2ECC71
-        elif status == "removed":
-            title = "🧹 盘口移出监控"
-            color = 0xE67E22
-            status_label = "移出监控"
-        fields = [
-            {"name": "状态", "value": status_label, "inline": True},
-            {"name": "分类", "value": category, "inline": True},
-            {"name": "到期", "value": _fmt_end_ts(end_ts), "inline": True},
-        ]
-        if market_id != "n/a":
-            fields.append({"name": "市场ID", "value": market_id, "inline": False})
-        return {
-            "title": title,
-            "color": color,
-            "description": market,
-            "fields": fields,
-            "url": _market_url(market_id, market),
-            "timestamp": ts.isoformat(),
-        }
 
-    signal = _get_signal(event) or "signal"
-    if signal == "major_change":
-        payload = event.payload if isinstance(event.payload, MajorChangePayload) else None
-        pct = payload.pct_change if payload else _payload_or_metrics(event, "pct_change")
-        price = payload.price if payload else _payload_or_metrics(event, "price")
-        prev_price = payload.prev_price if payload else _payload_or_metrics(event, "prev_price")
-        window = payload.window_sec if payload else _payload_or_metrics(event, "window_sec")
-        source = payload.source if payload else _payload_or_metrics(event, "source")
-        summary = _summary_major_change(market, pct, window, side, source)
-        fields = [
-            {"name": "摘要", "value": summary, "inline": False},
-            {
-                "name": "价格",
-                "value": f"{_fmt_price(prev_price)} → {_fmt_price(price)}",
-                "inline": True,
-            },
-            {"name": "窗口", "value": f"{window}s", "inline": True},
-            {"name": "来源", "value": str(source), "inline": True},
+def _embed_monitoring_status(event: DomainEvent) -> dict | None:
+    payload = event.payload if isinstance(event.payload, MonitoringStatusPayload) else None
+    metrics = event.metrics
+    status = payload.status if payload else metrics.get("status", "connected")
+    market_count = payload.market_count if payload else metrics.get("market_count")
+    event_count = payload.event_count if payload else metrics.get("event_count")
+    token_count = payload.token_count if payload else metrics.get("token_count")
+    unsub_count = payload.unsubscribable_count if payload else metrics.get("unsubscribable_count")
+    unsub_event_count = (
+        payload.unsubscribable_event_count if payload else metrics.get("unsubscribable_event_count")
+    )
+
+    raw = event.raw or {}
+    subscribed = raw.get("subscribed_markets") if isinstance(raw, dict) else None
+    unsub = raw.get("unsubscribable_markets") if isinstance(raw, dict) else None
+
+    subscribed_lines = _format_market_list(subscribed, limit=12)
+    unsub_lines = _format_market_list(unsub, limit=8)
+    category_counts = _format_category_counts(subscribed)
+
+    fields = [
+        {"name": "状态", "value": str(status), "inline": True},
+        {
+            "name": "统计",
+            "value": _format_monitoring_stats(
+                event_count,
+                market_count,
+                token_count,
+                unsub_event_count,
+                unsub_count,
+            ),
+            "inline": True,
+        },
+        {"name": "分类统计", "value": category_counts, "inline": False},
+        {"name": "监控盘口", "value": subscribed_lines, "inline": False},
+        {"name": "灰盘（无 orderbook）", "value": unsub_lines, "inline": False},
+    ]
+    return {
+        "title": "🟢 已连接 | 监控启动",
+        "color": 0x2ECC71,
+        "fields": fields,
+        "timestamp": _embed_timestamp(event),
+    }
+
+
+def _embed_health(event: DomainEvent) -> dict | None:
+    payload = event.payload if isinstance(event.payload, HealthPayload) else None
+    metrics = event.metrics
+    status = payload.status if payload else metrics.get("status", "unknown")
+    duration = payload.duration_ms if payload else metrics.get("duration_ms")
+    color = 0x2ECC71 if status == "refresh_ok" else 0xE74C3C
+    fields = [{"name": "状态", "value": str(status), "inline": True}]
+    if duration is not None:
+        fields.append({"name": "耗时(ms)", "value": str(duration), "inline": True})
+    return {
+        "title": "🩺 健康检查",
+        "color": color,
+        "fields": fields,
+        "timestamp": _embed_timestamp(event),
+    }
+
+
+def _embed_major_change(event: DomainEvent) -> dict | None:
+    market, market_id, category = _embed_labels(event)
+    side = event.side
+    payload = event.payload if isinstance(event.payload, MajorChangePayload) else None
+    pct = payload.pct_change if payload else _payload_or_metrics(event, "pct_change")
+    price = payload.price if payload else _payload_or_metrics(event, "price")
+    prev_price = payload.prev_price if payload else _payload_or_metrics(event, "prev_price")
+    window = payload.window_sec if payload else _payload_or_metrics(event, "window_sec")
+    source = payload.source if payload else _payload_or_metrics(event, "source")
+    summary = _summary_major_change(market, pct, window, side, source)
+    fields = [
+        {"name": "摘要", "value": summary, "inline": False},
+        {
+            "name": "价格",
+            "value": f"{_fmt_price(prev_price)} → {_fmt_price(price)}",
+            "inline": True,
+        },
+        {"name": "窗口", "value": f"{window}s", "inline": True},
+        {"name": "来源", "value": str(source), "inline": True},
+        {"name": "方向", "value": _fmt_side(side), "inline": True},
+        {"name": "分类", "value": category, "inline": True},
+    ]
+    if market_id != "n/a":
+        fields.append({"name": "市场ID", "value": market_id, "inline": False})
+    return {
+        "title": "🚨 重大变动",
+        "color": _color_for_side(side) or 0xE74C3C,
+        "description": market,
+        "fields": fields,
+        "url": _market_url(market_id, market),
+        "timestamp": _embed_timestamp(event),
+    }
+
+
+def _embed_big_trade(event: DomainEvent) -> dict | None:
+    market, market_id, category = _embed_labels(event)
+    side = event.side
+    payload = event.payload if isinstance(event.payload, BigTradePayload) else None
+    notional = payload.notional if payload else _payload_or_metrics(event, "notional")
+    price = payload.price if payload else _payload_or_metrics(event, "price")
+    size = payload.size if payload else _payload_or_metrics(event, "size")
+    vol_1m = payload.vol_1m if payload else _payload_or_metrics(event, "vol_1m")
+    summary = _summary_big_trade(market, notional, side)
+    fields = [
+        {"name": "摘要", "value": summary, "inline": False},
+        {"name": "价格", "value": _fmt_price(price), "inline": True},
+        {"name": "数量", "value": _fmt_float(size), "inline": True},
+        {"name": "成交额", "value": _fmt_money(notional), "inline": True},
+    ]
+    if vol_1m is not None:
+        fields.append({"name": "1m 放量", "value": _fmt_money(vol_1m), "inline": True})
+    fields.extend(
+        [
             {"name": "方向", "value": _fmt_side(side), "inline": True},
             {"name": "分类", "value": category, "inline": True},
         ]
-        if market_id != "n/a":
-            fields.append({"name": "市场ID", "value": market_id, "inline": False})
-        return {
-            "title": "🚨 重大变动",
-            "color": _color_for_side(side) or 0xE74C3C,
-            "description": market,
-            "fields": fields,
-            "url": _market_url(market_id, market),
-            "timestamp": ts.isoformat(),
-        }
+    )
+    if market_id != "n/a":
+        fields.append({"name": "市场ID", "value": market_id, "inline": False})
+    return {
+        "title": "💥 大单成交",
+        "color": _color_for_side(side) or 0xF39C12,
+        "description": market,
+        "fields": fields,
+        "url": _market_url(market_id, market),
+        "timestamp": _embed_timestamp(event),
+    }
 
-    if signal == "big_trade":
-        payload = event.payload if isinstance(event.payload, BigTradePayload) else None
-        notional = payload.notional if payload else _payload_or_metrics(event, "notional")
-        price = payload.price if payload else _payload_or_metrics(event, "price")
-        size = payload.size if payload else _payload_or_metrics(event, "size")
-        vol_1m = payload.vol_1m if payload else _payload_or_metrics(event, "vol_1m")
-        summary = _summary_big_trade(market, notional, side)
-        fields = [
-            {"name": "摘要", "value": summary, "inline": False},
-            {"name": "价格", "value": _fmt_price(price), "inline": True},
-            {"name": "数量", "value": _fmt_float(size), "inline": True},
-            {"name": "成交额", "value": _fmt_money(notional), "inline": True},
-        ]
-        if vol_1m is not None:
-            fields.append({"name": "1m 放量", "value": _fmt_money(vol_1m), "inline": True})
-        fields.extend(
-            [
-                {"name": "方向", "value": _fmt_side(side), "inline": True},
-                {"name": "分类", "value": category, "inline": True},
-            ]
-        )
-        if market_id != "n/a":
-            fields.append({"name": "市场ID", "value": market_id, "inline": False})
-        return {
-            "title": "💥 大单成交",
-            "color": _color_for_side(side) or 0xF39C12,
-            "description": market,
-            "fields": fields,
-            "url": _market_url(market_id, market),
-            "timestamp": ts.isoformat(),
-        }
 
-    if signal == "volume_spike_1m":
-        payload = event.payload if isinstance(event.payload, VolumeSpikePayload) else None
-        vol = payload.vol_1m if payload else _payload_or_metrics(event, "vol_1m")
-        summary = _summary_volume_spike(market, vol)
-        fields = [
-            {"name": "摘要", "value": summary, "inline": False},
-            {"name": "成交额", "value": _fmt_money(vol), "inline": True},
-            {"name": "分类", "value": category, "inline": True},
-        ]
-        if market_id != "n/a":
-            fields.append({"name": "市场ID", "value": market_id, "inline": False})
-        return {
-            "title": "📈 放量（1分钟）",
-            "color": 0xF1C40F,
-            "description": market,
-            "fields": fields,
-            "url": _market_url(market_id, market),
-            "timestamp": ts.isoformat(),
-        }
+def _embed_volume_spike_1m(event: DomainEvent) -> dict | None:
+    market, market_id, category = _embed_labels(event)
+    payload = event.payload if isinstance(event.payload, VolumeSpikePayload) else None
+    vol = payload.vol_1m if payload else _payload_or_metrics(event, "vol_1m")
+    summary = _summary_volume_spike(market, vol)
+    fields = [
+        {"name": "摘要", "value": summary, "inline": False},
+        {"name": "成交额", "value": _fmt_money(vol), "inline": True},
+        {"name": "分类", "value": category, "inline": True},
+    ]
+    if market_id != "n/a":
+        fields.append({"name": "市场ID", "value": market_id, "inline": False})
+    return {
+        "title": "📈 放量（1分钟）",
+        "color": 0xF1C40F,
+        "description": market,
+        "fields": fields,
+        "url": _market_url(market_id, market),
+        "timestamp": _embed_timestamp(event),
+    }
 
-    if signal == "web_volume_spike":
-        payload = event.payload if isinstance(event.payload, WebVolumeSpikePayload) else None
-        delta = payload.delta_volume if payload else _payload_or_metrics(event, "delta_volume")
-        window = payload.window_sec if payload else _payload_or_metrics(event, "window_sec")
-        total = payload.volume_24h if payload else _payload_or_metrics(event, "volume_24h")
-        summary = _summary_web_volume(market, delta, window)
-        fields = [
-            {"name": "摘要", "value": summary, "inline": False},
-            {"name": "区间成交", "value": _fmt_money(delta), "inline": True},
-            {"name": "24h 成交", "value": _fmt_money(total), "inline": True},
-            {"name": "窗口", "value": f"{window}s", "inline": True},
-            {"name": "分类", "value": category, "inline": True},
-        ]
-        if market_id != "n/a":
-            fields.append({"name": "市场ID", "value": market_id, "inline": False})
-        return {
-            "title": "🧊 灰盘放量（无 orderbook）",
-            "color": 0x1ABC9C,
-            "description": market,
-            "fields": fields,
-            "url": _market_url(market_id, market),
-            "timestamp": ts.isoformat(),
-        }
 
+def _embed_web_volume_spike(event: DomainEvent) -> dict | None:
+    market, market_id, category = _embed_labels(event)
+    payload = event.payload if isinstance(event.payload, WebVolumeSpikePayload) else None
+    delta = payload.delta_volume if payload else _payload_or_metrics(event, "delta_volume")
+    window = payload.window_sec if payload else _payload_or_metrics(event, "window_sec")
+    total = payload.volume_24h if payload else _payload_or_metrics(event, "volume_24h")
+    summary = _summary_web_volume(market, delta, window)
+    fields = [
+        {"name": "摘要", "value": summary, "inline": False},
+        {"name": "区间成交", "value": _fmt_money(delta), "inline": True},
+        {"name": "24h 成交", "value": _fmt_money(total), "inline": True},
+        {"name": "窗口", "value": f"{window}s", "inline": True},
+        {"name": "分类", "value": category, "inline": True},
+    ]
+    if market_id != "n/a":
+        fields.append({"name": "市场ID", "value": market_id, "inline": False})
+    return {
+        "title": "🧊 灰盘放量（无 orderbook）",
+        "color": 0x1ABC9C,
+        "description": market,
+        "fields": fields,
+        "url": _market_url(market_id, market),
+        "timestamp": _embed_timestamp(event),
+    }
+
+
+def _embed_generic(event: DomainEvent) -> dict | None:
+    market, market_id, category = _embed_labels(event)
+    signal = _get_signal(event) or "signal"
     summary = f"{market} | {signal}"
     fields = [
         {"name": "摘要", "value": summary, "inline": False},
@@ -429,21 +708,43 @@ def _build_embed(event: DomainEvent) -> dict | None:
         "description": market,
         "fields": fields,
         "url": _market_url(market_id, market),
-        "timestamp": ts.isoformat(),
+        "timestamp": _embed_timestamp(event),
     }
 
 
+_EVENT_EMBED_BUILDERS: dict[EventType, Callable[[DomainEvent], dict | None]] = {
+    EventType.MARKET_LIFECYCLE: _embed_market_lifecycle,
+    EventType.MONITORING_STATUS: _embed_monitoring_status,
+    EventType.HEALTH_EVENT: _embed_health,
+}
+_SIGNAL_EMBED_BUILDERS: dict[str, Callable[[DomainEvent], dict | None]] = {
+    "major_change": _embed_major_change,
+    "big_trade": _embed_big_trade,
+    "volume_spike_1m": _embed_volume_spike_1m,
+    "web_volume_spike": _embed_web_volume_spike,
+}
+
+
 def _build_aggregate_embed(events: list[DomainEvent], max_items: int) -> dict | None:
     if not events:
         return None
-    latest_ts_ms = max(event.ts_ms for event in events)
-    ts = datetime.fromtimestamp(latest_ts_ms / 1000, tz=UTC)
     event = events[0]
     market = event.title or event.topic_key or "(unknown market)"
     market_id = event.market_id or "n/a"
     category = event.category or "n/a"
     signal = _get_signal(event) or "signal"
 
+    latest_ts_ms = event.ts_ms
+    directions: list[float] = []
+    track_direction = signal == "major_change"
+    for item in events:
+        if item.ts_ms > latest_ts_ms:
+            latest_ts_ms = item.ts_ms
+        if track_direction:
+            value = _payload_or_metrics(item, "pct_change_signed")
+            if value is not None:
+                directions.append(float(value))
+
     lines = _aggregate_lines(events, signal, max_items)
     summary = f"{market} | {signal} | {len(events)} 个结果触发"
     fields = [
@@ -462,17 +763,16 @@ def _build_aggregate_embed(events: list[DomainEvent], max_items: int) -> dict |
 
     return {
         "title": _aggregate_title(signal),
-        "color": _aggregate_color(events, signal),
+        "color": _aggregate_color(directions, signal),
         "description": market,
         "fields": fields,
         "url": _market_url(market_id, market),
-        "timestamp": ts.isoformat(),
+        "timestamp": _iso_from_ms(latest_ts_ms),
     }
 
 
 def _fallback_text(event: DomainEvent) -> str:
-    ts = datetime.fromtimestamp(event.ts_ms / 1000, tz=UTC)
-    ts_str = ts.strftime("%Y-%m-%d %H:%M:%S UTC")
+    ts_str = _utc_text_from_ms(event.ts_ms)
     market = event.title or event.topic_key or "(unknown market)"
     market_id = event.market_id or "n/a"
     signal = _get_signal(event) or event.event_type.value
@@ -480,31 +780,61 @@ def _fallback_text(event: DomainEvent) -> str:
     return message[:2000]
 
 
+def _utc_parts(seconds: int) -> tuple[str, str]:
+    tm = time.gmtime(seconds)
+    return (
+        f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}",
+        f"{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}",
+    )
+
+
+@lru_cache(maxsize=4096)
+def _iso_from_ms(ms: int) -> str:
+    # Same output as datetime.fromtimestamp(ms / 1000, tz=UTC).isoformat().
+    seconds, millis = divmod(int(ms), 1000)
+    day, clock = _utc_parts(seconds)
+    text = f"{day}T{clock}"
+    if millis:
+        text += f".{millis * 1000:06d}"
+    return text + "+00:00"
+
+
+@lru_cache(maxsize=4096)
+def _utc_text_from_ms(ms: int) -> str:
+    day, clock = _utc_parts(int(ms) // 1000)
+    return f"{day} {clock} UTC"
+
+
 def _retry_after(resp: httpx.Response) -> float | None:
+    # Headers first: Discord always sets them on 429, so the body rarely needs decoding.
+    for header in ("X-RateLimit-Reset-After", "Retry-After"):
+        header_value = resp.headers.get(header)
+        if header_value:
+            try:
+                return float(header_value)
+            except ValueError:
+                continue
+
     try:
-        data = resp.json()
-        retry_after = data.get("retry_after")
+        retry_after = orjson.loads(resp.content).get("retry_after")
         if retry_after is not None:
             return float(retry_after)
-    except (ValueError, TypeError):
+    except (orjson.JSONDecodeError, AttributeError, TypeError, ValueError):
         pass
-
-    header_value = resp.headers.get("Retry-After")
-    if header_value:
-        try:
-            return float(header_value)
-        except ValueError:
-            return None
     return None
 
 
-def _backoff_delay(attempt: int) -> float:
-    base = 0.5
-    delay = base * (2**attempt)
-    jitter = random.random() * 0.25
-    return min(delay + jitter, 30.0)
+_BACKOFF_BASE_SEC = 0.5
+_BACKOFF_CAP_SEC = 30.0
 
 
+def _backoff_delay(prev_delay: float) -> float:
+    # Decorrelated jitter: spreads concurrent retries apart instead of retrying in lockstep.
+    upper = max(_BACKOFF_BASE_SEC, prev_delay) * 3
+    return min(_BACKOFF_CAP_SEC, random.uniform(_BACKOFF_BASE_SEC, upper))
+
+
+@lru_cache(maxsize=2048)
 def _short_id(value: str) -> str:
     if value == "n/a":
         return value
@@ -522,55 +852,70 @@ def _fmt_float(value: float | int | None) -> str:
 def _fmt_pct(value: float | int | None) -> str:
     if value is None:
         return "n/a"
-    return f"{float(value):.2f}%"
+    return _pct_text(float(value))
 
 
 def _fmt_money(value: float | int | None) -> str:
     if value is None:
         return "n/a"
-    return f"${float(value):,.2f}"
+    return _money_text(float(value))
 
 
 def _fmt_price(value: float | int | None) -> str:
     if value is None:
         return "n/a"
-    return f"{float(value) * 100:.1f}¢"
+    return _price_text(float(value))
 
 
-def _fmt_end_ts(value: float | int | None) -> str:
-    if value is None:
-        return "n/a"
-    try:
-        ts = datetime.fromtimestamp(float(value) / 1000, tz=UTC)
-    except (TypeError, ValueError, OSError):
-        return "n/a"
-    return ts.strftime("%Y-%m-%d")
+@lru_cache(maxsize=2048)
+def _pct_text(value: float) -> str:
+    return f"{value:.2f}%"
+
+
+@lru_cache(maxsize=2048)
+def _money_text(value: float) -> str:
+    return f"${value:,.2f}"
+
+
+@lru_cache(maxsize=2048)
+def _price_text(value: float) -> str:
+    return f"{value * 100:.1f}¢"
 
 
+@lru_cache(maxsize=2048)
 def _fmt_side(value: str | None) -> str:
     return value or "未知"
 
 
+_SIDE_COLORS = {"YES": 0x2ECC71, "NO": 0xE74C3C}
+
+
+@lru_cache(maxsize=2048)
 def _color_for_side(value: str | None) -> int | None:
     if value is None:
         return None
-    side = value.upper()
-    if side == "YES":
-        return 0x2ECC71
-    if side == "NO":
-        return 0xE74C3C
-    return None
+    return _SIDE_COLORS.get(value.upper())
 
 
+# One entry per (market_id, title); titles are stable for a market's lifetime.
+@lru_cache(maxsize=4096)
 def _market_url(market_id: str, market: str) -> str | None:
     if market_id == "n/a":
         return None
-    slug = slugify(market, lowercase=True)
+    slug = _slug(market)
     if not slug:
         return None
     return f"https://polymarket.com/market/{slug}"
 
 
+def _slug(text: str) -> str:
+    # Non-ASCII needs transliteration and "&" may start an HTML entity slugify decodes.
+    if not text.isascii() or "&" in text:
+        return slugify(text, lowercase=True)
+    text = _SLUG_NUMBER_COMMA_RE.sub("", text.lower())
+    return _SLUG_RE.sub("-", text).strip("-")
+
+
 def _summary_major_change(
     market: str,
     pct: float | int | None,
@@ -726,32 +1071,27 @@ def _aggregate_lines(events: list[DomainEvent], signal: str, max_items: int) ->
             return f"{name}: 1m 放量 {vol}"
         return f"{name}"
 
-    sorted_events = sorted(events, key=sort_key, reverse=True)
-    lines = [format_line(event) for event in sorted_events[:max_items]]
-    if len(sorted_events) > max_items:
-        lines.append(f"... 还有 {len(sorted_events) - max_items} 个结果")
+    top_events = heapq.nlargest(max_items, events, key=sort_key)
+    lines = [format_line(event) for event in top_events]
+    if len(events) > max_items:
+        lines.append(f"... 还有 {len(events) - max_items} 个结果")
     return lines
 
 
+_AGGREGATE_TITLES = {
+    "major_change": "📊 多选盘异动汇总",
+    "big_trade": "💥 多选盘大单汇总",
+    "volume_spike_1m": "📈 多选盘放量汇总",
+}
+
+
 def _aggregate_title(signal: str) -> str:
-    if signal == "major_change":
-        return "📊 多选盘异动汇总"
-    if signal == "big_trade":
-        return "💥 多选盘大单汇总"
-    if signal == "volume_spike_1m":
-        return "📈 多选盘放量汇总"
-    return "🔔 多选盘预警汇总"
+    return _AGGREGATE_TITLES.get(signal, "🔔 多选盘预警汇总")
 
 
-def _aggregate_color(events: list[DomainEvent], signal: str) -> int:
+def _aggregate_color(directions: list[float], signal: str) -> int:
     if signal != "major_change":
         return 0x3498DB
-    directions = []
-    for event in events:
-        value = _payload_or_metrics(event, "pct_change_signed")
-        if value is None:
-            continue
-        directions.append(float(value))
     if not directions:
         return 0xE67E22
     if all(val > 0 for val in directions):
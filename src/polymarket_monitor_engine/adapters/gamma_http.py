@@ -1,20 +1,186 @@
 from __future__ import annotations
 
-import json
-from collections.abc import Iterable
+import asyncio
+import calendar
+import importlib.util
+import random
+import time
+from collections.abc import Callable, Iterable
 from datetime import UTC, datetime
+from functools import lru_cache
+from itertools import chain
 from typing import Any
 
 import httpx
+import orjson
+import redis.asyncio as redis
 import structlog
 from aiolimiter import AsyncLimiter
 from cachetools import TTLCache
-from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 
 from polymarket_monitor_engine.domain.models import Market, OutcomeToken, Tag
 
 logger = structlog.get_logger(__name__)
 
+# Pagination fans out over one host, so keep plenty of warm keep-alive connections.
+# Idle expiry outlives the default 60s discovery refresh so each refresh reuses the pool.
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=50,
+    keepalive_expiry=150,
+)
+_shared_clients: dict[str, httpx.AsyncClient] = {}
+# Catalogs holding each pooled client; the last one to close() shuts the client down.
+_shared_client_refs: dict[str, int] = {}
+# Bigger result sets are parsed into Market models in a worker thread to keep the loop free.
+_PARSE_OFFLOAD_THRESHOLD = 100
+# Optional Redis L2 for the parsed tags list, so restarts and sibling workers skip /tags.
+_shared_tag_stores: dict[str, redis.Redis] = {}
+_TAGS_STORE_KEY = "gamma:tags:v1:"
+
+# Full-jitter exponential backoff between retries: uniform(0, min(cap, base * 2**n)).
+_RETRY_BACKOFF_BASE_SEC = 0.5
+_RETRY_BACKOFF_CAP_SEC = 5.0
+
+# Gamma spells most fields several ways; the first truthy key wins, like an `or` chain.
+_MARKET_ID_KEYS = ("conditionId", "condition_id", "id", "market_id", "marketId")
+_QUESTION_KEYS = ("question", "title", "description")
+_EVENT_ID_KEYS = ("_event_id", "event_id", "eventId")
+_ENABLE_ORDERBOOK_KEYS = ("enableOrderBook", "enable_orderbook")
+_END_TS_KEYS = ("end_ts", "endDate", "endDateIso")
+_LIQUIDITY_KEYS = ("liquidity", "liquidityUSD", "liquidityNum")
+_VOLUME_24H_KEYS = ("volume_24h", "volume24h", "volume24hr", "volume24hrClob")
+# Lower-cased events sort keys accepted for each metric.
+_VOLUME_SORT_KEYS = frozenset(("volume24hr", "volume24h", "volume_24h", "volume24hrclob"))
+_LIQUIDITY_SORT_KEYS = frozenset(("liquidity", "liquidityusd", "liquiditynum"))
+# Accepted boolean spellings for string flags; anything else falls back to the default.
+_BOOL_STRINGS = {"true": True, "1": True, "yes": True, "false": False, "0": False, "no": False}
+_TOKEN_ID_KEYS = ("token_id", "tokenId", "clobTokenId", "asset_id", "assetId", "id")
+
+
+def _fast_iso_ms(text: str) -> int | None:
+    # Handles the UTC "YYYY-MM-DDTHH:MM:SS[.fff]Z" shape Gamma emits; None means "use datetime".
+    if text.endswith(("Z", "z")):
+        body = text[:-1]
+    elif text.endswith("+00:00"):
+        body = text[:-6]
+    else:
+        return None
+    if (
+        len(body) < 19
+        or body[4] != "-"
+        or body[7] != "-"
+        or body[10] not in "Tt "
+        or body[13] != ":"
+        or body[16] != ":"
+    ):
+        return None
+    fields = (body[0:4], body[5:7], body[8:10], body[11:13], body[14:16], body[17:19])
+    if not all(field.isdigit() for field in fields):
+        return None
+    year, month, day, hour, minute, second = (int(field) for field in fields)
+    if not (1 <= month <= 12 and hour < 24 and minute < 60 and second < 60):
+        return None
+    if not 1 <= day <= calendar.monthrange(year, month)[1]:
+        return None
+    millis = 0
+    fraction = body[19:]
+    if fraction:
+        digits = fraction[1:]
+        if fraction[0] != "." or not digits.isdigit():
+            return None
+        millis = int(digits[:3].ljust(3, "0"))
+    return calendar.timegm((year, month, day, hour, minute, second, 0, 0, 0)) * 1000 + millis
+
+
+@lru_cache(maxsize=8192)
+def _parse_end_ts_str(value: str) -> int | None:
+    # endDate strings repeat across an event's markets and across refreshes.
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    fast = _fast_iso_ms(value)
+    if fast is not None:
+        return fast
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return int(dt.astimezone(UTC).timestamp() * 1000)
+
+
+def _pick(raw: dict[str, Any], keys: tuple[str, ...]) -> Any:
+    value = None
+    for key in keys:
+        value = raw.get(key)
+        if value:
+            return value
+    return value
+
+
+def _zero_metric(event: dict[str, Any]) -> float:
+    return 0.0
+
+
+def _sid(value: Any) -> str:
+    # Ids almost always arrive as str already; falsy values map to "" like `str(v or "")`.
+    if type(value) is str:
+        return value
+    return str(value) if value else ""
+
+
+def _str_items(items: list[Any]) -> list[str]:
+    # Token id arrays are normally all non-empty strings; skip the per-item str() then.
+    if all(type(item) is str and item for item in items):
+        return items[:]
+    return [str(item) for item in items if item]
+
+
+def _get_shared_client(base_url: str, timeout_sec: float) -> httpx.AsyncClient:
+    client = _shared_clients.get(base_url)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=timeout_sec,
+            limits=_HTTP_LIMITS,
+            http2=importlib.util.find_spec("h2") is not None,
+        )
+        _shared_clients[base_url] = client
+        _shared_client_refs[base_url] = 0
+    _shared_client_refs[base_url] += 1
+    return client
+
+
+async def _release_shared_client(base_url: str, client: httpx.AsyncClient) -> None:
+    if _shared_clients.get(base_url) is not client:
+        return
+    _shared_client_refs[base_url] -= 1
+    if _shared_client_refs[base_url] <= 0:
+        del _shared_clients[base_url]
+        del _shared_client_refs[base_url]
+        await client.aclose()
+
+
+def _get_tags_store(url: str) -> redis.Redis:
+    store = _shared_tag_stores.get(url)
+    if store is None:
+        store = redis.from_url(url, decode_responses=False)
+        _shared_tag_stores[url] = store
+    return store
+
+
+async def aclose_shared_clients() -> None:
+    clients = list(_shared_clients.values())
+    _shared_clients.clear()
+    _shared_client_refs.clear()
+    for client in clients:
+        await client.aclose()
+    stores = list(_shared_tag_stores.values())
+    _shared_tag_stores.clear()
+    for store in stores:
+        await store.aclose()
+
 
 class GammaHttpCatalog:
     def __init__(
@@ -31,9 +197,18 @@ class GammaHttpCatalog:
         events_sort_primary: str | None = "volume24hr",
         events_sort_secondary: str | None = "liquidity",
         events_sort_desc: bool = True,
+        page_concurrency: int = 4,
+        markets_cache_sec: int = 30,
+        tags_redis_url: str | None = None,
+        client: httpx.AsyncClient | None = None,
+        tags_store: redis.Redis | None = None,
     ) -> None:
-        self._client = httpx.AsyncClient(base_url=base_url, timeout=timeout_sec)
+        # Injected clients belong to the caller; pooled ones are released per base_url.
+        self._shared_key = None if client is not None else base_url
+        self._log = logger.bind(component="gamma_http", base_url=base_url)
+        self._client = client or _get_shared_client(base_url, timeout_sec)
         self._page_size = page_size
+        self._page_concurrency = max(1, int(page_concurrency))
         self._use_events_endpoint = use_events_endpoint
         self._related_tags = related_tags
         self._request_interval_ms = request_interval_ms
@@ -43,24 +218,53 @@ class GammaHttpCatalog:
         self._events_sort_primary = self._normalize_sort_key(events_sort_primary)
         self._events_sort_secondary = self._normalize_sort_key(events_sort_secondary)
         self._events_sort_desc = bool(events_sort_desc)
-        self._tags_cache: TTLCache[str, list[Tag]] = TTLCache(
-            maxsize=1,
-            ttl=max(1, int(tags_cache_sec)),
-        )
+        # Single entry, so a (expires_at, tags) tuple swapped atomically replaces a TTLCache.
+        self._tags_ttl = max(1, int(tags_cache_sec))
+        self._tags_cache: tuple[float, list[Tag]] | None = None
+        self._tags_inflight: asyncio.Task[list[Tag]] | None = None
+        self._tags_store = tags_store
+        if self._tags_store is None and tags_redis_url:
+            self._tags_store = _get_tags_store(tags_redis_url)
+        self._tags_store_key = _TAGS_STORE_KEY + base_url
+        self._markets_cache: TTLCache[tuple[str, bool, bool], list[Market]] | None = None
+        if markets_cache_sec > 0:
+            self._markets_cache = TTLCache(maxsize=256, ttl=int(markets_cache_sec))
+        # In-flight fetches per key; entries are removed as soon as the fetch finishes.
+        self._markets_inflight: dict[tuple[str, bool, bool], asyncio.Task[list[Market]]] = {}
         self._rate_limiter: AsyncLimiter | None = None
         if self._request_interval_ms > 0:
             period = max(0.001, self._request_interval_ms / 1000.0)
             self._rate_limiter = AsyncLimiter(1, period)
 
     async def list_tags(self) -> list[Tag]:
-        cached = self._tags_cache.get("tags")
-        if cached is not None:
-            return cached
+        cached = self._tags_cache
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+        # Concurrent misses share one /tags pagination; shield so one caller's
+        # cancellation doesn't abort the fetch the others are waiting on.
+        if self._tags_inflight is None:
+            task = asyncio.create_task(self._fetch_tags())
+            task.add_done_callback(self._clear_tags_inflight)
+            self._tags_inflight = task
+        return await asyncio.shield(self._tags_inflight)
+
+    def _clear_tags_inflight(self, task: asyncio.Task[list[Tag]]) -> None:
+        if self._tags_inflight is task:
+            self._tags_inflight = None
+
+    async def _fetch_tags(self) -> list[Tag]:
+        parsed = await self._load_stored_tags()
+        if parsed is None:
+            parsed = await self._paginate_tags()
+            await self._store_tags(parsed)
+        self._tags_cache = (time.monotonic() + self._tags_ttl, parsed)
+        return parsed
 
+    async def _paginate_tags(self) -> list[Tag]:
         items = await self._paginate("/tags", {})
         parsed: list[Tag] = []
         for raw in items:
-            tag_id = str(raw.get("id") or raw.get("tag_id") or "")
+            tag_id = _sid(raw.get("id") or raw.get("tag_id"))
             if not tag_id:
                 continue
             parsed.append(
@@ -71,15 +275,63 @@ class GammaHttpCatalog:
                     raw=raw or None,
                 )
             )
-        self._tags_cache["tags"] = parsed
         return parsed
 
+    async def _load_stored_tags(self) -> list[Tag] | None:
+        if self._tags_store is None:
+            return None
+        try:
+            stored = await self._tags_store.get(self._tags_store_key)
+            if stored is None:
+                return None
+            return [Tag.model_validate(item) for item in orjson.loads(stored)]
+        except (redis.RedisError, ValueError) as exc:
+            self._log.warning("gamma_tags_store_failed", op="get", error=str(exc))
+            return None
+
+    async def _store_tags(self, tags: list[Tag]) -> None:
+        if self._tags_store is None:
+            return
+        payload = orjson.dumps([tag.model_dump() for tag in tags])
+        try:
+            await self._tags_store.set(self._tags_store_key, payload, ex=self._tags_ttl)
+        except redis.RedisError as exc:
+            self._log.warning("gamma_tags_store_failed", op="set", error=str(exc))
+
     async def list_markets(
         self,
         tag_id: str,
         active: bool = True,
         closed: bool = False,
     ) -> list[Market]:
+        if self._markets_cache is None:
+            return await self._fetch_markets(tag_id, active, closed)
+        key = (tag_id, active, closed)
+        cached = self._markets_cache.get(key)
+        if cached is None:
+            # Concurrent misses for one key share a single fetch.
+            task = self._markets_inflight.get(key)
+            if task is None:
+                task = asyncio.create_task(self._fetch_and_cache_markets(key))
+                task.add_done_callback(lambda done: self._clear_markets_inflight(key, done))
+                self._markets_inflight[key] = task
+            cached = await asyncio.shield(task)
+        # Callers mutate returned markets (e.g. category); the cached objects are never handed out.
+        return [market.model_copy() for market in cached]
+
+    async def _fetch_and_cache_markets(self, key: tuple[str, bool, bool]) -> list[Market]:
+        markets = await self._fetch_markets(*key)
+        if self._markets_cache is not None:
+            self._markets_cache[key] = markets
+        return markets
+
+    def _clear_markets_inflight(
+        self, key: tuple[str, bool, bool], task: asyncio.Task[list[Market]]
+    ) -> None:
+        if self._markets_inflight.get(key) is task:
+            del self._markets_inflight[key]
+
+    async def _fetch_markets(self, tag_id: str, active: bool, closed: bool) -> list[Market]:
         if self._use_events_endpoint:
             params = {
                 "tag_id": tag_id,
@@ -102,17 +354,9 @@ class GammaHttpCatalog:
                 and len(events) > self._events_limit_per_category
             ):
                 events = events[: self._events_limit_per_category]
-            markets: list[Market] = []
-            for event in events:
-                markets.extend(self._extract_markets_from_event(event))
-            return [
-                m
-                for m in markets
-                if m.market_id
-                and (m.active if active else True)
-                and (not m.closed if not closed else True)
-                and not m.resolved
-            ]
+            if len(events) > _PARSE_OFFLOAD_THRESHOLD:
+                return await asyncio.to_thread(self._markets_from_events, events, active, closed)
+            return self._markets_from_events(events, active, closed)
 
         params = {
             "tag_id": tag_id,
@@ -121,7 +365,31 @@ class GammaHttpCatalog:
             "limit": self._page_size,
         }
         items = await self._paginate("/markets", params)
-        markets = [self._parse_market(item) for item in items]
+        if len(items) > _PARSE_OFFLOAD_THRESHOLD:
+            return await asyncio.to_thread(self._markets_from_items, items)
+        return self._markets_from_items(items)
+
+    @staticmethod
+    def _markets_from_events(
+        events: list[dict[str, Any]], active: bool, closed: bool
+    ) -> list[Market]:
+        extract = GammaHttpCatalog._extract_markets_from_event
+        markets: list[Market] = []
+        append = markets.append
+        for event in events:
+            for m in extract(event):
+                if (
+                    m.market_id
+                    and not m.resolved
+                    and (m.active or not active)
+                    and (closed or not m.closed)
+                ):
+                    append(m)
+        return markets
+
+    @staticmethod
+    def _markets_from_items(items: list[dict[str, Any]]) -> list[Market]:
+        markets = [GammaHttpCatalog._parse_market(item) for item in items]
         return [m for m in markets if m.market_id]
 
     async def list_top_markets(
@@ -155,7 +423,11 @@ class GammaHttpCatalog:
         return [m for m in markets if m.market_id and m.active and not m.closed and not m.resolved]
 
     async def close(self) -> None:
-        await self._client.aclose()
+        # Drops this catalog's hold on the pooled client; other catalogs keep using it.
+        if self._shared_key is None:
+            return
+        shared_key, self._shared_key = self._shared_key, None
+        await _release_shared_client(shared_key, self._client)
 
     async def _paginate(
         self,
@@ -169,25 +441,44 @@ class GammaHttpCatalog:
         max_items = self._normalize_limit(max_items)
 
         while True:
-            query = dict(params)
-            page_limit = limit
-            if max_items is not None:
-                remaining = max_items - len(collected)
-                if remaining <= 0:
+            # First page alone; once it comes back full, fetch the next pages as a window.
+            window = 1 if offset == 0 else self._page_concurrency
+            budget = None if max_items is None else max_items - len(collected)
+            queries: list[dict[str, Any]] = []
+            next_offset = offset
+            for _ in range(window):
+                page_limit = limit if budget is None else min(limit, budget)
+                if page_limit <= 0:
                     break
-                page_limit = min(page_limit, remaining)
-            if page_limit <= 0:
+                query = dict(params)
+                query["limit"] = page_limit
+                query["offset"] = next_offset
+                queries.append(query)
+                next_offset += page_limit
+                if budget is not None:
+                    budget -= page_limit
+            if not queries:
                 break
-            query["limit"] = page_limit
-            query["offset"] = offset
 
-            payload = await self._request_json(path, query)
-            items = self._extract_items(payload)
-            collected.extend(items)
+            if len(queries) == 1:
+                payloads = [await self._request_json(path, queries[0])]
+            else:
+                # One rate-limit slot per window; the pages inside it go out together.
+                await self._rate_limit_pause()
+                payloads = await asyncio.gather(
+                    *(self._request_json(path, query, pause=False) for query in queries)
+                )
 
-            if not items or len(items) < page_limit:
+            exhausted = False
+            for query, payload in zip(queries, payloads, strict=True):
+                items = self._extract_items(payload)
+                collected.extend(items)
+                if not items or len(items) < query["limit"]:
+                    exhausted = True
+                    break
+            if exhausted:
                 break
-            offset += page_limit
+            offset = next_offset
 
         if max_items is not None and len(collected) > max_items:
             collected = collected[:max_items]
@@ -195,7 +486,7 @@ class GammaHttpCatalog:
         log_payload = {"path": path, "count": len(collected)}
         if max_items is not None:
             log_payload["limit"] = max_items
-        logger.info("gamma_paginate", **log_payload)
+        self._log.info("gamma_paginate", **log_payload)
         return collected
 
     @staticmethod
@@ -217,15 +508,12 @@ class GammaHttpCatalog:
         async with self._rate_limiter:
             return None
 
-    async def _request_json(self, path: str, params: dict[str, Any]) -> Any:
-        async for attempt in AsyncRetrying(
-            stop=stop_after_attempt(self._retry_max_attempts),
-            wait=wait_exponential_jitter(initial=0.5, max=5),
-            retry=retry_if_exception(self._is_retryable_http_error),
-            reraise=True,
-        ):
-            with attempt:
+    async def _request_json(self, path: str, params: dict[str, Any], pause: bool = True) -> Any:
+        attempts = max(1, self._retry_max_attempts)
+        for attempt in range(attempts):
+            if pause or attempt:
                 await self._rate_limit_pause()
+            try:
                 resp = await self._client.get(path, params=params)
                 if resp.status_code == 429 or 500 <= resp.status_code < 600:
                     raise httpx.HTTPStatusError(
@@ -234,8 +522,13 @@ class GammaHttpCatalog:
                         response=resp,
                     )
                 resp.raise_for_status()
-                return resp.json()
-
+            except (httpx.HTTPStatusError, httpx.RequestError) as exc:
+                if attempt + 1 >= attempts or not self._is_retryable_http_error(exc):
+                    raise
+                cap = min(_RETRY_BACKOFF_CAP_SEC, _RETRY_BACKOFF_BASE_SEC * 2**attempt)
+                await asyncio.sleep(random.uniform(0, cap))
+                continue
+            return orjson.loads(resp.content)
         return None
 
     @staticmethod
@@ -271,13 +564,15 @@ class GammaHttpCatalog:
         secondary = self._events_sort_secondary
         reverse = self._events_sort_desc
 
+        # Resolve each sort key to its metric once; sorted() then evaluates it once per event.
+        primary_metric = self._event_metric(primary)
+        secondary_metric = self._event_metric(secondary)
+
         def sort_key(event: dict[str, Any]) -> tuple[float, float]:
-            primary_value = self._event_metric(event, primary)
-            secondary_value = self._event_metric(event, secondary)
-            return (primary_value, secondary_value)
+            return (primary_metric(event), secondary_metric(event))
 
         sorted_events = sorted(events, key=sort_key, reverse=reverse)
-        logger.info(
+        self._log.info(
             "gamma_events_sort",
             primary=primary,
             secondary=secondary,
@@ -287,19 +582,17 @@ class GammaHttpCatalog:
         return sorted_events
 
     @staticmethod
-    def _event_metric(event: dict[str, Any], key: str | None) -> float:
-        if not key:
-            return 0.0
-        key_norm = key.strip().lower()
-        if key_norm in {"volume24hr", "volume24h", "volume_24h", "volume24hrclob"}:
-            return GammaHttpCatalog._event_volume_24h(event)
-        if key_norm in {"liquidity", "liquidityusd", "liquiditynum"}:
-            return GammaHttpCatalog._event_liquidity(event)
-        return 0.0
+    def _event_metric(key: str | None) -> Callable[[dict[str, Any]], float]:
+        key_norm = key.strip().lower() if key else ""
+        if key_norm in _VOLUME_SORT_KEYS:
+            return GammaHttpCatalog._event_volume_24h
+        if key_norm in _LIQUIDITY_SORT_KEYS:
+            return GammaHttpCatalog._event_liquidity
+        return _zero_metric
 
     @staticmethod
     def _event_volume_24h(event: dict[str, Any]) -> float:
-        for key in ("volume_24h", "volume24h", "volume24hr", "volume24hrClob"):
+        for key in _VOLUME_24H_KEYS:
             value = GammaHttpCatalog._to_float(event.get(key))
             if value is not None:
                 return value
@@ -307,7 +600,7 @@ class GammaHttpCatalog:
 
     @staticmethod
     def _event_liquidity(event: dict[str, Any]) -> float:
-        for key in ("liquidity", "liquidityUSD", "liquidityNum"):
+        for key in _LIQUIDITY_KEYS:
             value = GammaHttpCatalog._to_float(event.get(key))
             if value is not None:
                 return value
@@ -318,23 +611,17 @@ class GammaHttpCatalog:
         markets_raw = event.get("markets") or []
         if not isinstance(markets_raw, list):
             return 0.0
+        if metric == "volume":
+            keys = _VOLUME_24H_KEYS
+        elif metric == "liquidity":
+            keys = _LIQUIDITY_KEYS
+        else:
+            return 0.0
         total = 0.0
         for item in markets_raw:
             if not isinstance(item, dict):
                 continue
-            if metric == "volume":
-                value = GammaHttpCatalog._to_float(
-                    item.get("volume_24h")
-                    or item.get("volume24h")
-                    or item.get("volume24hr")
-                    or item.get("volume24hrClob")
-                )
-            elif metric == "liquidity":
-                value = GammaHttpCatalog._to_float(
-                    item.get("liquidity") or item.get("liquidityUSD") or item.get("liquidityNum")
-                )
-            else:
-                value = None
+            value = GammaHttpCatalog._to_float(_pick(item, keys))
             if value is None:
                 continue
             total += value
@@ -345,68 +632,67 @@ class GammaHttpCatalog:
         markets_raw = event.get("markets") or []
         if not isinstance(markets_raw, list):
             return []
-        event_id = str(event.get("id") or event.get("event_id") or event.get("eventId") or "")
+        event_id = _sid(event.get("id") or event.get("event_id") or event.get("eventId"))
         event_title = event.get("title") or event.get("slug") or ""
-        event_end = event.get("end_ts") or event.get("endDate") or event.get("endDateIso")
+        event_end = _pick(event, _END_TS_KEYS)
         event_enable_ob = event.get("enableOrderBook")
-        enriched: list[dict[str, Any]] = []
+        parse_market = GammaHttpCatalog._parse_market
+        markets: list[Market] = []
         for item in markets_raw:
             if not isinstance(item, dict):
                 continue
-            if event_id and "event_id" not in item and "eventId" not in item:
-                item["_event_id"] = event_id
-            if event_end is not None and not any(
-                key in item for key in ("end_ts", "endDate", "endDateIso")
-            ):
-                item["endDate"] = event_end
-            if event_enable_ob is not None and "enableOrderBook" not in item:
-                item["enableOrderBook"] = event_enable_ob
-            enriched.append(item)
-        markets = [GammaHttpCatalog._parse_market(item) for item in enriched]
-        for market in markets:
+            market = parse_market(
+                item,
+                event_id=event_id,
+                event_end=event_end,
+                event_enable_ob=event_enable_ob,
+            )
             if not market.question:
                 market.question = event_title
+            markets.append(market)
         return markets
 
     @staticmethod
-    def _parse_market(raw: dict[str, Any]) -> Market:
-        market_id = str(
-            raw.get("conditionId")
-            or raw.get("condition_id")
-            or raw.get("id")
-            or raw.get("market_id")
-            or raw.get("marketId")
-            or ""
-        )
-        question = raw.get("question") or raw.get("title") or raw.get("description") or ""
-        event_id = str(raw.get("_event_id") or raw.get("event_id") or raw.get("eventId") or "")
-        active = GammaHttpCatalog._to_bool(raw.get("active"), default=True)
-        closed = GammaHttpCatalog._to_bool(raw.get("closed"), default=False)
-        resolved = GammaHttpCatalog._to_bool(raw.get("resolved"), default=False)
-        enable_orderbook_raw = raw.get("enableOrderBook") or raw.get("enable_orderbook")
+    def _parse_market(
+        raw: dict[str, Any],
+        *,
+        event_id: str = "",
+        event_end: Any = None,
+        event_enable_ob: Any = None,
+    ) -> Market:
+        # Event-level fields fill in for keys the market omits; raw stays unmodified.
+        # Local aliases: this runs once per market on every catalog refresh.
+        get = raw.get
+        to_bool = GammaHttpCatalog._to_bool
+        to_float = GammaHttpCatalog._to_float
+        market_id = _sid(_pick(raw, _MARKET_ID_KEYS))
+        question = _pick(raw, _QUESTION_KEYS) or ""
+        if not event_id or "event_id" in raw or "eventId" in raw:
+            event_id = _sid(_pick(raw, _EVENT_ID_KEYS))
+        active = to_bool(get("active"), default=True)
+        closed = to_bool(get("closed"), default=False)
+        resolved = to_bool(get("resolved"), default=False)
+        if event_enable_ob is not None and "enableOrderBook" not in raw:
+            enable_orderbook_raw = event_enable_ob or get("enable_orderbook")
+        else:
+            enable_orderbook_raw = _pick(raw, _ENABLE_ORDERBOOK_KEYS)
         enable_orderbook = (
-            None
-            if enable_orderbook_raw is None
-            else GammaHttpCatalog._to_bool(enable_orderbook_raw, default=True)
-        )
-        end_ts = GammaHttpCatalog._parse_end_ts(
-            raw.get("end_ts") or raw.get("endDate") or raw.get("endDateIso")
-        )
-        liquidity = GammaHttpCatalog._to_float(
-            raw.get("liquidity") or raw.get("liquidityUSD") or raw.get("liquidityNum")
-        )
-        volume_24h = GammaHttpCatalog._to_float(
-            raw.get("volume_24h")
-            or raw.get("volume24h")
-            or raw.get("volume24hr")
-            or raw.get("volume24hrClob")
+            None if enable_orderbook_raw is None else to_bool(enable_orderbook_raw, default=True)
         )
+        if event_end is not None and not any(key in raw for key in _END_TS_KEYS):
+            end_raw = event_end or None
+        else:
+            end_raw = _pick(raw, _END_TS_KEYS)
+        end_ts = GammaHttpCatalog._parse_end_ts(end_raw)
+        liquidity = to_float(_pick(raw, _LIQUIDITY_KEYS))
+        volume_24h = to_float(_pick(raw, _VOLUME_24H_KEYS))
 
-        clob_token_ids = GammaHttpCatalog._parse_clob_token_ids(raw.get("clobTokenIds"))
+        clob_token_ids = GammaHttpCatalog._parse_clob_token_ids(get("clobTokenIds"))
         outcomes = GammaHttpCatalog._extract_outcomes(raw)
         outcomes = GammaHttpCatalog._attach_outcome_token_ids(outcomes, clob_token_ids)
-        token_ids = clob_token_ids + [outcome.token_id for outcome in outcomes if outcome.token_id]
-        token_ids = [token_id for token_id in dict.fromkeys(token_ids) if token_id]
+        # Ordered de-dup of CLOB ids followed by outcome ids; the dict keeps insertion order.
+        outcome_ids = (outcome.token_id for outcome in outcomes)
+        token_ids = list(dict.fromkeys(t for t in chain(clob_token_ids, outcome_ids) if t))
 
         return Market(
             market_id=market_id,
@@ -442,14 +728,7 @@ class GammaHttpCatalog:
         if isinstance(value, (int, float)):
             return int(value)
         if isinstance(value, str):
-            try:
-                return int(value)
-            except ValueError:
-                try:
-                    dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
-                    return int(dt.astimezone(UTC).timestamp() * 1000)
-                except ValueError:
-                    return None
+            return _parse_end_ts_str(value)
         return None
 
     @staticmethod
@@ -463,18 +742,15 @@ class GammaHttpCatalog:
 
     @staticmethod
     def _to_bool(value: Any, default: bool) -> bool:
+        # Gamma mostly sends real JSON booleans; check those by identity first.
+        if value is True or value is False:
+            return value
         if value is None:
             return default
-        if isinstance(value, bool):
-            return value
         if isinstance(value, (int, float)):
             return bool(value)
         if isinstance(value, str):
-            lowered = value.strip().lower()
-            if lowered in {"true", "1", "yes"}:
-                return True
-            if lowered in {"false", "0", "no"}:
-                return False
+            return _BOOL_STRINGS.get(value.strip().lower(), default)
         return default
 
     @staticmethod
@@ -490,8 +766,8 @@ class GammaHttpCatalog:
         outcomes_raw = raw.get("outcomes")
         if isinstance(outcomes_raw, str):
             try:
-                outcomes_raw = json.loads(outcomes_raw)
-            except json.JSONDecodeError:
+                outcomes_raw = orjson.loads(outcomes_raw)
+            except orjson.JSONDecodeError:
                 outcomes_raw = [item.strip() for item in outcomes_raw.split(",") if item.strip()]
 
         if isinstance(outcomes_raw, list):
@@ -535,17 +811,17 @@ class GammaHttpCatalog:
         if value is None:
             return []
         if isinstance(value, list):
-            return [str(item) for item in value if item]
+            return _str_items(value)
         if isinstance(value, str):
             text = value.strip()
             if not text:
                 return []
             if text.startswith("["):
                 try:
-                    parsed = json.loads(text)
+                    parsed = orjson.loads(text)
                     if isinstance(parsed, list):
-                        return [str(item) for item in parsed if item]
-                except json.JSONDecodeError:
+                        return _str_items(parsed)
+                except orjson.JSONDecodeError:
                     pass
             if "," in text:
                 return [item.strip() for item in text.split(",") if item.strip()]
@@ -554,7 +830,8 @@ class GammaHttpCatalog:
 
     @staticmethod
     def _coerce_token_id(token_raw: dict[str, Any]) -> str | None:
-        for key in ("token_id", "tokenId", "clobTokenId", "asset_id", "assetId", "id"):
-            if key in token_raw and token_raw[key] is not None:
-                return str(token_raw[key])
+        for key in _TOKEN_ID_KEYS:
+            value = token_raw.get(key)
+            if value is not None:
+                return value if type(value) is str else str(value)
         return None
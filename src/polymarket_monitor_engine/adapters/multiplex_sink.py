@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Iterable
 
 import structlog
@@ -24,29 +25,51 @@ class MultiplexEventSink:
         self._required = set(required_sinks or [])
         self._routes = routes or {}
         self._transform = transform
+        # Routes are fixed after construction, so resolve each event type's sinks once.
+        self._route_table: dict[EventType, tuple[str, ...]] = {
+            event_type: tuple(
+                name for name in self._resolve_targets(event_type) if name in self._sinks
+            )
+            for event_type in EventType
+        }
 
     async def publish(self, event: DomainEvent) -> None:
-        target_names = self._resolve_targets(event.event_type)
+        names = self._route_table[event.event_type]
+        if not names:
+            return
         payload = self._transform_event(event)
-        errors: dict[str, Exception] = {}
-
-        for name in target_names:
-            sink = self._sinks.get(name)
-            if sink is None:
-                continue
-            try:
-                await sink.publish(payload)
-            except Exception as exc:  # noqa: BLE001
-                errors[name] = exc
-                logger.warning("sink_publish_failed", sink=name, error=str(exc))
+        if len(names) == 1:
+            ok = await self._publish_to_sink(names[0], payload)
+            failed = set() if ok else {names[0]}
+        else:
+            # Sinks are independent, so a slow one (e.g. Discord) must not delay the others.
+            results = await asyncio.gather(
+                *(self._publish_to_sink(name, payload) for name in names)
+            )
+            failed = {name for name, ok in zip(names, results, strict=True) if not ok}
 
-        if not errors:
+        if not failed:
             return
         if self._mode == "required_sinks" or self._required:
-            missing = sorted(set(errors) & self._required)
+            missing = sorted(failed & self._required)
             if missing:
                 raise RuntimeError(f"Required sinks failed: {missing}")
 
+    async def close(self) -> None:
+        for name, sink in self._sinks.items():
+            try:
+                await sink.close()
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("sink_close_failed", sink=name, error=str(exc))
+
+    async def _publish_to_sink(self, name: str, event: DomainEvent) -> bool:
+        try:
+            await self._sinks[name].publish(event)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("sink_publish_failed", sink=name, error=str(exc))
+            return False
+        return True
+
     def _resolve_targets(self, event_type: EventType) -> list[str]:
         routed = self._routes.get(event_type.value) or self._routes.get(event_type.name)
         if routed:
@@ -55,7 +78,6 @@ class MultiplexEventSink:
 
     def _transform_event(self, event: DomainEvent) -> DomainEvent:
         if self._transform == "compact":
-            data = event.model_dump()
-            data.pop("raw", None)
-            return DomainEvent.model_validate(data)
+            # Shallow copy without raw; the event was validated when it was built.
+            return event.model_copy(update={"raw": None})
         return event
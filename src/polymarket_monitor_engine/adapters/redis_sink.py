@@ -1,23 +1,100 @@
 from __future__ import annotations
 
-import orjson
+import asyncio
+import contextlib
+
 import redis.asyncio as redis
 import structlog
+from pydantic import TypeAdapter
 
 from polymarket_monitor_engine.domain.events import DomainEvent
 
 logger = structlog.get_logger(__name__)
 
+# Serializes straight to JSON bytes in pydantic-core, skipping the model_dump() dict.
+_EVENT_JSON = TypeAdapter(DomainEvent)
+# Payloads waiting for the publisher task; the oldest are dropped when Redis can't keep up.
+_QUEUE_MAXSIZE = 10_000
+# Upper bound on PUBLISH commands sent in one pipelined round trip.
+_MAX_PIPELINE = 256
+
 
 class RedisPubSubSink:
     def __init__(self, url: str, channel: str) -> None:
         self._redis = redis.from_url(url, decode_responses=False)
         self._channel = channel
+        self._queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=_QUEUE_MAXSIZE)
+        self._task: asyncio.Task[None] | None = None
+        self._dropped_events = 0
+        # Background send failures not yet reported to a caller, and the last error seen.
+        self._failed_events = 0
+        self._last_error: BaseException | None = None
+
+    @property
+    def dropped_events(self) -> int:
+        return self._dropped_events
 
     async def publish(self, event: DomainEvent) -> None:
-        payload = orjson.dumps(event.model_dump())
-        await self._redis.publish(self._channel, payload)
-        logger.info("redis_publish", channel=self._channel, event_id=event.event_id)
+        if self._queue.full():
+            self._queue.get_nowait()
+            self._queue.task_done()
+            self._dropped_events += 1
+            logger.warning("redis_queue_dropped", dropped_total=self._dropped_events)
+        self._queue.put_nowait(_EVENT_JSON.dump_json(event))
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        # Sends happen in the background, so surface their failures on the next publish;
+        # that keeps required-sink checks in MultiplexEventSink meaningful.
+        self._raise_failure()
+
+    async def flush(self) -> None:
+        if self._task is not None and not self._task.done():
+            await self._queue.join()
+        else:
+            while not self._queue.empty():
+                await self._send_batch(self._take_batch([]))
+        self._raise_failure()
 
     async def close(self) -> None:
-        await self._redis.close()
+        try:
+            await self.flush()
+        finally:
+            if self._task is not None:
+                self._task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await self._task
+                self._task = None
+            await self._redis.close()
+
+    async def _run(self) -> None:
+        # Whatever queued up while the previous pipeline was in flight goes out in the next one.
+        while True:
+            await self._send_batch(self._take_batch([await self._queue.get()]))
+
+    def _take_batch(self, batch: list[bytes]) -> list[bytes]:
+        while len(batch) < _MAX_PIPELINE and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _send_batch(self, batch: list[bytes]) -> None:
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for payload in batch:
+                    pipe.publish(self._channel, payload)
+                await pipe.execute()
+            logger.info("redis_publish", channel=self._channel, count=len(batch))
+        except Exception as exc:  # noqa: BLE001
+            self._failed_events += len(batch)
+            self._last_error = exc
+            logger.warning("redis_publish_failed", count=len(batch), error=str(exc))
+        finally:
+            for _ in batch:
+                self._queue.task_done()
+
+    def _raise_failure(self) -> None:
+        if self._last_error is None:
+            return
+        error, failed = self._last_error, self._failed_events
+        self._last_error = None
+        self._failed_events = 0
+        raise RuntimeError(f"Redis publish failed for {failed} events") from error
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import orjson
 import structlog
 
 from polymarket_monitor_engine.domain.events import DomainEvent
@@ -9,4 +10,8 @@ logger = structlog.get_logger(__name__)
 
 class StdoutSink:
     async def publish(self, event: DomainEvent) -> None:
-        logger.info("domain_event", payload=event.model_dump())
+        # Encoded once by pydantic-core; the orjson log renderer embeds the fragment as-is.
+        logger.info("domain_event", payload=orjson.Fragment(event.model_dump_json()))
+
+    async def close(self) -> None:
+        return None
@@ -87,6 +87,7 @@ class PolymarketComponent:
             if self._dashboard is not None:
                 await self._dashboard.stop()
             await self._feed.close()
+            await self._sink.close()
 
     async def _refresh_loop(self) -> None:
         while True:
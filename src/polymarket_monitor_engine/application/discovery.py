@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Iterable
 from dataclasses import dataclass
 
 import structlog
@@ -11,6 +13,9 @@ from polymarket_monitor_engine.ports.clock import ClockPort
 
 logger = structlog.get_logger(__name__)
 
+# Per-tag market fetches run concurrently; the catalog's rate limiter still paces requests.
+_TAG_FETCH_CONCURRENCY = 8
+
 
 @dataclass(slots=True)
 class DiscoveryResult:
@@ -66,13 +71,12 @@ class MarketDiscovery:
         results: dict[str, list[Market]] = {}
         unsubscribable: list[Market] = []
 
-        for category in categories:
-            tag_id = tag_map.get(category)
-            if tag_id is None:
+        fetched = await self._list_markets_for(tag_map.get(category) for category in categories)
+        for category, markets in zip(categories, fetched, strict=True):
+            if markets is None:
                 logger.warning("tag_not_found", category=category)
                 results[category] = []
                 continue
-            markets = await self._catalog.list_markets(tag_id, active=True, closed=False)
             eligible_markets = [m for m in markets if m.active and not m.closed and not m.resolved]
             eligible_markets = self._filter_expired(eligible_markets, category, now_ms)
             eligible_markets = self._apply_focus_filter(eligible_markets, category=category)
@@ -158,6 +162,17 @@ class MarketDiscovery:
         )
         return filtered
 
+    async def _list_markets_for(self, tag_ids: Iterable[str | None]) -> list[list[Market] | None]:
+        semaphore = asyncio.Semaphore(_TAG_FETCH_CONCURRENCY)
+
+        async def fetch(tag_id: str | None) -> list[Market] | None:
+            if tag_id is None:
+                return None
+            async with semaphore:
+                return await self._catalog.list_markets(tag_id, active=True, closed=False)
+
+        return list(await asyncio.gather(*(fetch(tag_id) for tag_id in tag_ids)))
+
     def _filter_expired(
         self,
         markets: list[Market],
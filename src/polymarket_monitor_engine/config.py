@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import contextlib
 import json
 import os
 from pathlib import Path
 from typing import Any
 
+import orjson
 import yaml
 from deepmerge import Merger
 from pydantic import BaseModel, Field, field_validator
@@ -101,6 +103,7 @@ class GammaSettings(BaseModel):
     base_url: str = "https://gamma-api.polymarket.com"
     timeout_sec: float = 10.0
     page_size: int = 200
+    page_concurrency: int = 4
     use_events_endpoint: bool = True
     events_limit_per_category: int | None = None
     events_sort_primary: str = "volume24hr"
@@ -109,6 +112,8 @@ class GammaSettings(BaseModel):
     related_tags: bool = False
     request_interval_ms: int = 0
     tags_cache_sec: int = 600
+    tags_redis_url: str | None = None
+    markets_cache_sec: int = 30
     retry_max_attempts: int = 5
 
 
@@ -119,6 +124,8 @@ class ClobSettings(BaseModel):
     initial_dump: bool = True
     max_frame_bytes: int = 1_000_000
     max_message_bytes: int | None = 2_000_000
+    recv_queue_size: int = 1024
+    compression: str | None = None
     ping_interval_sec: int | None = 10
     ping_message: str = "PING"
     pong_message: str = "pong"
@@ -147,6 +154,7 @@ class DiscordSinkSettings(BaseModel):
     aggregate_max_items: int = 5
     log_payloads: bool = True
     log_payloads_path: str = "logs/discord.out.jsonl"
+    batch_window_sec: float = 0.5
 
 
 class SinkSettings(BaseModel):
@@ -185,6 +193,8 @@ class Settings(BaseSettings):
     sinks: SinkSettings = Field(default_factory=SinkSettings)
 
 
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 _MERGER = Merger([(dict, ["merge"]), (list, ["override"])], ["override"], ["override"])
 
 
@@ -195,11 +205,10 @@ def _merge_settings(base: dict[str, Any], override: dict[str, Any]) -> dict[str,
 def load_settings(path: Path | None) -> Settings:
     file_data: dict[str, Any] = {}
     if path is not None:
-        raw = path.read_text(encoding="utf-8")
         if path.suffix in {".yaml", ".yml"}:
-            file_data = yaml.safe_load(raw) or {}
+            file_data = _load_yaml_cached(path)
         elif path.suffix == ".json":
-            file_data = json.loads(raw)
+            file_data = json.loads(path.read_text(encoding="utf-8"))
         else:
             raise ValueError(f"Unsupported config format: {path}")
 
@@ -210,6 +219,23 @@ def load_settings(path: Path | None) -> Settings:
     return Settings.model_validate(merged)
 
 
+def _load_yaml_cached(path: Path) -> dict[str, Any]:
+    cache_path = path.with_name(f"{path.name}.cache.json")
+    mtime_ns = path.stat().st_mtime_ns
+    try:
+        cached = orjson.loads(cache_path.read_bytes())
+        if isinstance(cached, dict) and cached.get("mtime_ns") == mtime_ns:
+            return cached.get("data") or {}
+    except (OSError, orjson.JSONDecodeError):
+        pass
+
+    data = yaml.load(path.read_text(encoding="utf-8"), Loader=_YAML_LOADER) or {}
+    # Best effort: read-only config dirs or non-JSON YAML values just skip the cache.
+    with contextlib.suppress(OSError, TypeError):
+        cache_path.write_bytes(orjson.dumps({"mtime_ns": mtime_ns, "data": data}))
+    return data
+
+
 def _sanitize_env_overrides(prefix: str = "PME__") -> None:
     list_env_keys = {
         f"{prefix}APP__CATEGORIES",
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from datetime import UTC, datetime
@@ -230,7 +231,8 @@ def _get_token_id(payload: dict[str, Any]) -> str | None:
     for key in ("asset_id", "assetId", "token_id", "tokenId", "clobTokenId"):
         value = payload.get(key)
         if value is not None:
-            return str(value)
+            # Interned so ids from every frame share the subscription set's string objects.
+            return sys.intern(str(value))
     return None
 
 
@@ -7,3 +7,5 @@ from polymarket_monitor_engine.domain.events import DomainEvent
 
 class EventSinkPort(Protocol):
     async def publish(self, event: DomainEvent) -> None: ...
+
+    async def close(self) -> None: ...
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from datetime import UTC, datetime
 from pathlib import Path
 
+import orjson
 import structlog
 
 GENZ_EVENT_MAP: dict[str, str] = {
@@ -59,6 +61,11 @@ def resolve_log_path(file_path: str | None, now: datetime | None = None) -> str
     return f"{file_path}-{ts}"
 
 
+def _orjson_dumps(obj: object, default: Callable[[object], object] = repr, **_: object) -> str:
+    # structlog passes json.dumps-style kwargs; orjson also inlines pre-encoded orjson.Fragment.
+    return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 def _apply_genz_style(style: str):
     style_value = (style or "").lower()
 
@@ -108,7 +115,7 @@ def configure_logging(
             _apply_genz_style(style),
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps),
         ],
         wrapper_class=structlog.make_filtering_bound_logger(numeric_level),
         cache_logger_on_first_use=True,
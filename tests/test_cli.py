@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from polymarket_monitor_engine.__main__ import _build_parser, parse_args
+
+
+def test_parse_args_without_flags_uses_defaults(monkeypatch, tmp_path) -> None:
+    monkeypatch.chdir(tmp_path)
+    args = parse_args([])
+
+    assert args.config is None
+    assert args.dashboard is False
+    assert args == _build_parser().parse_args([])
+
+
+def test_parse_args_with_flags(tmp_path) -> None:
+    config_path = tmp_path / "custom.yaml"
+    args = parse_args(["--config", str(config_path), "--dashboard"])
+
+    assert args.config == Path(config_path)
+    assert args.dashboard is True
+
+
+def test_parse_args_help_exits(capsys) -> None:
+    with pytest.raises(SystemExit) as excinfo:
+        parse_args(["--help"])
+
+    assert excinfo.value.code == 0
+    assert capsys.readouterr().out == _build_parser().format_help()
@@ -31,7 +31,7 @@ class FakeWebSocket:
 
         return _iter()
 
-    async def send(self, data: str | bytes) -> None:
+    async def send(self, data: str | bytes, text: bool | None = None) -> None:
         self.sent.append(data)
 
     async def close(self) -> None:
@@ -86,6 +86,41 @@ async def test_clob_ws_subscribe_and_receive_trade() -> None:
     assert subscribe_payloads
     assert subscribe_payloads[0]["assets_ids"] == ["token-1"]
     assert subscribe_payloads[0]["type"] == "market"
+    assert b"pong" in fake_ws.sent
+
+
+@pytest.mark.asyncio
+async def test_clob_ws_accepts_bytes_like_frames() -> None:
+    trade_payload = json.dumps(
+        {"event_type": "trade", "asset_id": "token-1", "price": 0.5, "size": 1, "ts_ms": 1}
+    ).encode()
+    fake_ws = FakeWebSocket(incoming=[bytearray(b"ping"), memoryview(trade_payload)])
+
+    feed = ClobWebSocketFeed(
+        ws_url="ws://example/ws/market",
+        channel="market",
+        custom_feature_enabled=True,
+        initial_dump=True,
+        ping_interval_sec=None,
+        ping_message="PING",
+        pong_message="pong",
+        reconnect_backoff_sec=1,
+        reconnect_max_sec=2,
+    )
+    await feed.subscribe(["token-1"])
+    feed._ws = fake_ws
+
+    async def _next_message():
+        async for message in feed.messages():
+            await feed.close()
+            return message
+        return None
+
+    message = await asyncio.wait_for(_next_message(), timeout=5)
+
+    assert isinstance(message, TradeMessage)
+    assert message.trade.token_id == "token-1"
+    assert b"pong" in fake_ws.sent
 
 
 @pytest.mark.asyncio
@@ -151,3 +186,117 @@ async def test_clob_ws_connect_uses_max_message_bytes(monkeypatch) -> None:
 
     assert captured["url"] == "ws://example/ws/market"
     assert captured["max_size"] == 2_000_000
+    assert captured["compression"] is None
+
+
+@pytest.mark.asyncio
+async def test_clob_ws_connect_appends_channel_to_base_url(monkeypatch) -> None:
+    captured: dict[str, object] = {}
+
+    async def fake_connect(url: str, **kwargs: object):
+        captured["url"] = url
+        return FakeWebSocket()
+
+    monkeypatch.setattr(websockets, "connect", fake_connect)
+
+    feed = ClobWebSocketFeed(
+        ws_url="wss://example/",
+        channel="market",
+        custom_feature_enabled=True,
+        initial_dump=True,
+        ping_interval_sec=None,
+        ping_message="PING",
+        pong_message="pong",
+        reconnect_backoff_sec=1,
+        reconnect_max_sec=2,
+    )
+    await feed.connect()
+
+    assert captured["url"] == "wss://example/ws/market"
+
+
+@pytest.mark.parametrize(
+    ("payload", "expected"),
+    [
+        ({"event_type": "last_trade_price"}, "trade"),
+        ({"event_type": "BOOK"}, "book"),
+        ({"type": "Price_Change"}, "price_change"),
+        ({"event_type": "market_resolved"}, "market_lifecycle"),
+        ({"bids": [], "asks": []}, "book"),
+        ({"event_type": "tick_size_change"}, "raw"),
+        ({"type": "PING"}, "ping"),
+        ({"event_type": "pong"}, "pong"),
+    ],
+)
+def test_clob_ws_classify(payload: dict, expected: str) -> None:
+    assert ClobWebSocketFeed._classify(payload) == expected
+
+
+@pytest.mark.asyncio
+async def test_clob_ws_drains_buffered_frames_in_order() -> None:
+    frames = [
+        json.dumps(
+            {"event_type": "trade", "asset_id": f"token-{idx}", "price": 0.5, "size": 1, "ts_ms": 1}
+        )
+        for idx in range(3)
+    ]
+    fake_ws = FakeWebSocket(incoming=["ping", *frames])
+
+    feed = ClobWebSocketFeed(
+        ws_url="ws://example/ws/market",
+        channel="market",
+        custom_feature_enabled=True,
+        initial_dump=True,
+        ping_interval_sec=None,
+        ping_message="PING",
+        pong_message="pong",
+        reconnect_backoff_sec=1,
+        reconnect_max_sec=2,
+        recv_queue_size=2,
+    )
+    await feed.subscribe(["token-0"])
+    feed._ws = fake_ws
+
+    async def _collect() -> list[str]:
+        seen: list[str] = []
+        async for message in feed.messages():
+            seen.append(message.trade.token_id)
+            if len(seen) == len(frames):
+                await feed.close()
+                break
+        return seen
+
+    token_ids = await asyncio.wait_for(_collect(), timeout=5)
+
+    assert token_ids == ["token-0", "token-1", "token-2"]
+
+
+@pytest.mark.asyncio
+async def test_clob_ws_add_and_remove_tokens_send_deltas() -> None:
+    fake_ws = FakeWebSocket()
+    feed = ClobWebSocketFeed(
+        ws_url="ws://example/ws/market",
+        channel="market",
+        custom_feature_enabled=True,
+        initial_dump=True,
+        ping_interval_sec=None,
+        ping_message="PING",
+        pong_message="pong",
+        reconnect_backoff_sec=1,
+        reconnect_max_sec=2,
+    )
+    feed._ws = fake_ws
+    await feed.subscribe(["token-1"])
+    await feed.add_tokens(["token-1", "token-2"])
+    await feed.remove_tokens(["token-1", "token-9"])
+
+    payloads = [_maybe_json(raw) for raw in fake_ws.sent]
+    assert payloads[0]["assets_ids"] == ["token-1"]
+    assert payloads[1] == {
+        "operation": "subscribe",
+        "custom_feature_enabled": True,
+        "assets_ids": ["token-2"],
+    }
+    assert payloads[2]["operation"] == "unsubscribe"
+    assert payloads[2]["assets_ids"] == ["token-1"]
+    assert feed._subscribed_ids == {"token-2"}
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 
 import pytest
 
@@ -55,3 +56,21 @@ def test_load_settings_unsupported_format(tmp_path) -> None:
     config_path.write_text("noop", encoding="utf-8")
     with pytest.raises(ValueError):
         load_settings(config_path)
+
+
+def test_load_settings_yaml_uses_json_cache_until_modified(tmp_path) -> None:
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("app:\n  categories: [finance]\n", encoding="utf-8")
+    cache_path = tmp_path / "config.yaml.cache.json"
+
+    assert load_settings(config_path).app.categories == ["finance"]
+    assert cache_path.exists()
+
+    cached = json.loads(cache_path.read_text(encoding="utf-8"))
+    cached["data"]["app"]["categories"] = ["cached"]
+    cache_path.write_text(json.dumps(cached), encoding="utf-8")
+    assert load_settings(config_path).app.categories == ["cached"]
+
+    config_path.write_text("app:\n  categories: [geopolitics]\n", encoding="utf-8")
+    os.utime(config_path, ns=(cached["mtime_ns"] + 1_000_000, cached["mtime_ns"] + 1_000_000))
+    assert load_settings(config_path).app.categories == ["geopolitics"]
@@ -1,14 +1,24 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import time
 
 import httpx
 import pytest
 
 from polymarket_monitor_engine.adapters.discord_sink import (
     DiscordWebhookSink,
+    _backoff_delay,
     _build_aggregate_embed,
     _build_embed,
+    _cooldown_until,
+    _fmt_money,
+    _fmt_price,
+    _iso_from_ms,
+    _retry_after,
+    _slug,
+    _utc_text_from_ms,
 )
 from polymarket_monitor_engine.domain.events import DomainEvent, EventType
 from polymarket_monitor_engine.domain.schemas.event_payloads import (
@@ -45,6 +55,48 @@ def test_discord_format_major_change() -> None:
     assert any(field.get("name") == "摘要" for field in embed.get("fields", []))
 
 
+@pytest.mark.parametrize(
+    "title",
+    [
+        "Will Trump's tariff hit 1,000%?",
+        "Bitcoin > $100k by 2025?",
+        "  --A & B--  ",
+        "Café olé",
+        "A &amp; B",
+        "Tom &lt;3 &#39;quotes&#39; &#x41;b &nbsp;",
+        "R&D",
+    ],
+)
+def test_discord_slug_matches_slugify(title: str) -> None:
+    from slugify import slugify
+
+    assert _slug(title) == slugify(title, lowercase=True)
+
+
+def test_discord_slug_fast_path_matches_slugify_on_ascii() -> None:
+    import random
+    import string
+
+    from slugify import slugify
+
+    rng = random.Random(7)
+    alphabet = string.printable + "&;#"
+    for _ in range(5000):
+        title = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 16)))
+        assert _slug(title) == slugify(title, lowercase=True), title
+
+
+@pytest.mark.parametrize("ts_ms", [0, 1_700_000_000_000, 1_700_000_000_123, 1_700_000_000_001])
+def test_discord_timestamp_helpers_match_datetime(ts_ms: int) -> None:
+    from datetime import UTC, datetime
+
+    expected = datetime.fromtimestamp(ts_ms / 1000, tz=UTC).isoformat()
+    assert _iso_from_ms(ts_ms) == expected
+    assert _utc_text_from_ms(ts_ms) == datetime.fromtimestamp(ts_ms / 1000, tz=UTC).strftime(
+        "%Y-%m-%d %H:%M:%S UTC"
+    )
+
+
 def test_discord_format_multi_outcome_aggregate() -> None:
     events = [
         DomainEvent(
@@ -179,6 +231,7 @@ async def test_discord_sink_logs_payload_to_file(monkeypatch, tmp_path) -> None:
     )
 
     await sink.publish(event)
+    await sink.close()
     await sink._client.aclose()
 
     lines = log_path.read_text(encoding="utf-8").strip().splitlines()
@@ -187,3 +240,409 @@ async def test_discord_sink_logs_payload_to_file(monkeypatch, tmp_path) -> None:
     assert payload.get("event") == "🧷 discord_outgoing"
     assert "payload" in payload
     assert payload["payload"].get("embeds")
+
+
+def test_discord_sinks_share_one_http_client(monkeypatch) -> None:
+    monkeypatch.setenv("DISCORD_WEBHOOK_URL", "https://example.com/webhook")
+    first = DiscordWebhookSink(max_retries=0, timeout_sec=1, log_payloads=False)
+    second = DiscordWebhookSink(max_retries=0, timeout_sec=5, log_payloads=False)
+
+    assert first._client is not None
+    assert first._client is second._client
+
+
+def test_discord_backoff_delay_is_decorrelated_and_capped() -> None:
+    delay = 0.0
+    for _ in range(50):
+        next_delay = _backoff_delay(delay)
+        assert 0.5 <= next_delay <= 30.0
+        assert next_delay <= max(0.5, delay) * 3
+        delay = next_delay
+
+
+@pytest.mark.asyncio
+async def test_discord_sink_batches_embeds_into_one_post(monkeypatch) -> None:
+    monkeypatch.setenv("DISCORD_WEBHOOK_URL", "https://example.com/webhook")
+    posted: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        posted.append(json.loads(request.content))
+        return httpx.Response(204)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    sink = DiscordWebhookSink(
+        max_retries=0,
+        timeout_sec=1,
+        aggregate_multi_outcome=False,
+        log_payloads=False,
+        batch_window_sec=5,
+        client=client,
+    )
+
+    for idx in range(12):
+        await sink.publish(
+            DomainEvent(
+                event_id=f"evt-{idx}",
+                ts_ms=1_700_000_000_000,
+                event_type=EventType.TRADE_SIGNAL,
+                market_id=f"m{idx}",
+                title=f"Market {idx}",
+                side="YES",
+                payload=MajorChangePayload(
+                    signal=SignalType.MAJOR_CHANGE,
+                    pct_change=6.0,
+                    pct_change_signed=6.0,
+                    direction="up",
+                    price=0.5,
+                    prev_price=0.47,
+                    window_sec=60,
+                    notional=0.0,
+                    source="trade",
+                ),
+            )
+        )
+    await sink.close()
+    await client.aclose()
+
+    assert [len(payload["embeds"]) for payload in posted] == [10, 2]
+
+
+@pytest.mark.asyncio
+async def test_discord_sink_rejects_oversized_payload_without_posting(monkeypatch) -> None:
+    monkeypatch.setenv("DISCORD_WEBHOOK_URL", "https://discord.test/webhook")
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(204)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    sink = DiscordWebhookSink(max_retries=0, timeout_sec=1, log_payloads=False, client=client)
+    with pytest.raises(RuntimeError):
+        await sink._post_payload({"embeds": [{"description": "x" * 6001}]})
+    assert calls == 0
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_discord_sink_bounds_pending_aggregates(monkeypatch) -> None:
+    monkeypatch.setenv("DISCORD_WEBHOOK_URL", "https://discord.test/webhook")
+    client = httpx.AsyncClient(transport=httpx.MockTransport(lambda _: httpx.Response(204)))
+    sink = DiscordWebhookSink(
+        max_retries=0,
+        timeout_sec=1,
+        aggregate_window_sec=60,
+        aggregate_max_items=1,
+        log_payloads=False,
+        client=client,
+    )
+
+    for idx in range(6):
+        await sink.publish(
+            DomainEvent(
+                event_id=f"evt-{idx}",
+                ts_ms=1_700_000_000_000 + idx,
+                event_type=EventType.TRADE_SIGNAL,
+                market_id="m1",
+                title="Multi Market",
+                side=f"Option {idx}",
+                payload=MajorChangePayload(
+                    signal=SignalType.MAJOR_CHANGE,
+                    pct_change=6.0,
+                    pct_change_signed=6.0,
+                    direction="up",
+                    price=0.5,
+                    prev_price=0.47,
+                    window_sec=60,
+                    notional=0.0,
+                    source="trade",
+                ),
+            )
+        )
+
+    assert sink.pending_depth == 4
+    assert sink.dropped_events == 2
+    await sink.close()
+    assert sink.pending_depth == 0
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_discord_sink_shares_retry_after_cooldown(monkeypatch) -> None:
+    url = "https://discord.test/cooldown"
+    monkeypatch.setenv("DISCORD_WEBHOOK_URL", url)
+    statuses = [429, 204, 204]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(statuses.pop(0), headers={"Retry-After": "0.05"})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr("polymarket_monitor_engine.adapters.discord_sink._COOLDOWN_JITTER_SEC", 0)
+    first = DiscordWebhookSink(max_retries=1, timeout_sec=1, log_payloads=False, client=client)
+    second = DiscordWebhookSink(max_retries=0, timeout_sec=1, log_payloads=False, client=client)
+
+    await first._post_body(b"{}")
+    assert url in _cooldown_until
+    _cooldown_until[url] = time.monotonic() + 0.05
+    started = time.monotonic()
+    await second._post_body(b"{}")
+    assert time.monotonic() - started >= 0.04
+    _cooldown_until.pop(url, None)
+    await client.aclose()
+
+
+def test_discord_retry_after_prefers_headers_over_body() -> None:
+    resp = httpx.Response(
+        429,
+        headers={"Retry-After": "2", "X-RateLimit-Reset-After": "1.25"},
+        json={"retry_after": 9},
+    )
+    assert _retry_after(resp) == 1.25
+    assert _retry_after(httpx.Response(429, headers={"Retry-After": "2"})) == 2.0
+    assert _retry_after(httpx.Response(429, json={"retry_after": 0.5})) == 0.5
+    assert _retry_after(httpx.Response(503, content=b"oops")) is None
+
+
+@pytest.mark.asyncio
+async def test_discord_sink_outbox_drops_oldest_when_full(monkeypatch) -> None:
+    monkeypatch.setenv("DISCORD_WEBHOOK_URL", "https://discord.test/outbox")
+    monkeypatch.setattr("polymarket_monitor_engine.adapters.discord_sink._OUTBOX_MAXSIZE", 2)
+    posted: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        posted.append(json.loads(request.content))
+        return httpx.Response(204)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    sink = DiscordWebhookSink(
+        max_retries=0,
+        timeout_sec=1,
+        aggregate_multi_outcome=False,
+        log_payloads=False,
+        batch_window_sec=5,
+        client=client,
+    )
+
+    for idx in range(3):
+        await sink.publish(
+            DomainEvent(
+                event_id=f"evt-{idx}",
+                ts_ms=1_700_000_000_000,
+                event_type=EventType.HEALTH_EVENT,
+                metrics={"status": f"status-{idx}"},
+            )
+        )
+    assert sink.dropped_events == 1
+    await sink.close()
+    await client.aclose()
+
+    values = [embed["fields"][0]["value"] for payload in posted for embed in payload["embeds"]]
+    assert values == ["status-1", "status-2"]
+
+
+@pytest.mark.parametrize("value", [0, 0.5, 12.34, 999.999, 1_234_567.891, -42.1])
+def test_discord_money_and_price_formatting(value: float) -> None:
+    assert _fmt_money(value) == f"${value:,.2f}"
+    assert _fmt_price(value / 100) == f"{value:.1f}¢"
+    assert _fmt_money(None) == "n/a"
+
+
+def test_discord_money_and_price_keep_float_rounding() -> None:
+    # Values whose decimal rounding differs from rounding value * 100 as an integer.
+    assert _fmt_price(0.0195) == "1.9¢"
+    assert _fmt_money(-133889.445) == "$-133,889.45"
+
+
+@pytest.mark.asyncio
+async def test_discord_sink_coalesces_identical_alerts_in_window(monkeypatch) -> None:
+    monkeypatch.setenv("DISCORD_WEBHOOK_URL", "https://discord.test/coalesce")
+    posted: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        posted.append(json.loads(request.content))
+        return httpx.Response(204)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    sink = DiscordWebhookSink(
+        max_retries=0,
+        timeout_sec=1,
+        aggregate_multi_outcome=False,
+        log_payloads=False,
+        batch_window_sec=5,
+        client=client,
+    )
+
+    # m1 repeats the same 5% move (collapsed), then moves 7% (a distinct alert, kept).
+    for idx, (market_id, pct) in enumerate([("m1", 5), ("m2", 5), ("m1", 5), ("m1", 7)]):
+        await sink.publish(
+            DomainEvent(
+                event_id=f"evt-{idx}",
+                ts_ms=1_700_000_000_000 + idx,
+                event_type=EventType.TRADE_SIGNAL,
+                market_id=market_id,
+                title=f"Market {market_id}",
+                side="YES",
+                payload=MajorChangePayload(
+                    signal=SignalType.MAJOR_CHANGE,
+                    pct_change=float(pct),
+                    pct_change_signed=float(pct),
+                    direction="up",
+                    price=0.5,
+                    prev_price=0.47,
+                    window_sec=60,
+                    notional=0.0,
+                    source="trade",
+                ),
+            )
+        )
+    await sink.close()
+    await client.aclose()
+
+    embeds = [embed for payload in posted for embed in payload["embeds"]]
+    assert [embed["description"] for embed in embeds] == ["Market m2", "Market m1", "Market m1"]
+    assert "5.00%" in embeds[1]["fields"][0]["value"]
+    assert "7.00%" in embeds[2]["fields"][0]["value"]
+    assert sink.coalesced_events == 1
+
+
+@pytest.mark.asyncio
+async def test_discord_sink_reports_outbox_failures_on_next_publish(monkeypatch) -> None:
+    monkeypatch.setenv("DISCORD_WEBHOOK_URL", "https://discord.test/failing")
+    statuses = [400, 204]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(statuses.pop(0))
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    sink = DiscordWebhookSink(
+        max_retries=0,
+        timeout_sec=1,
+        aggregate_multi_outcome=False,
+        log_payloads=False,
+        batch_window_sec=0.01,
+        client=client,
+    )
+
+    def event(idx: int) -> DomainEvent:
+        return DomainEvent(
+            event_id=f"evt-{idx}",
+            ts_ms=1_700_000_000_000,
+            event_type=EventType.HEALTH_EVENT,
+            metrics={"status": f"status-{idx}"},
+        )
+
+    await sink.publish(event(0))
+    await asyncio.sleep(0.05)
+    with pytest.raises(RuntimeError, match="1 embeds"):
+        await sink.publish(event(1))
+    await sink.close()
+    await client.aclose()
+
+    assert statuses == []
+
+
+@pytest.mark.asyncio
+async def test_discord_sink_close_drains_outbox_when_aggregate_flush_fails(monkeypatch) -> None:
+    monkeypatch.setenv("DISCORD_WEBHOOK_URL", "https://discord.test/close")
+    posted: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        posted.append(json.loads(request.content))
+        return httpx.Response(204)
+
+    def broken_aggregate(events):
+        raise ValueError("boom")
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    sink = DiscordWebhookSink(
+        max_retries=0,
+        timeout_sec=1,
+        aggregate_window_sec=60,
+        log_payloads=False,
+        batch_window_sec=5,
+        client=client,
+    )
+    monkeypatch.setattr(sink, "_build_aggregate_payload", broken_aggregate)
+
+    await sink.publish(
+        DomainEvent(
+            event_id="evt-health",
+            ts_ms=1_700_000_000_000,
+            event_type=EventType.HEALTH_EVENT,
+            metrics={"status": "queued"},
+        )
+    )
+    await sink.publish(
+        DomainEvent(
+            event_id="evt-agg",
+            ts_ms=1_700_000_000_000,
+            event_type=EventType.TRADE_SIGNAL,
+            market_id="m1",
+            title="Multi Market",
+            side="Option A",
+            payload=MajorChangePayload(
+                signal=SignalType.MAJOR_CHANGE,
+                pct_change=6.0,
+                pct_change_signed=6.0,
+                direction="up",
+                price=0.5,
+                prev_price=0.47,
+                window_sec=60,
+                notional=0.0,
+                source="trade",
+            ),
+        )
+    )
+    with pytest.raises(RuntimeError) as excinfo:
+        await sink.close()
+    await client.aclose()
+
+    assert isinstance(excinfo.value.__cause__, ValueError)
+    assert sink._outbox_task is None
+    values = [embed["fields"][0]["value"] for payload in posted for embed in payload["embeds"]]
+    assert values == ["queued"]
+
+
+@pytest.mark.asyncio
+async def test_discord_sink_close_waits_for_in_flight_outbox_post(monkeypatch) -> None:
+    monkeypatch.setenv("DISCORD_WEBHOOK_URL", "https://discord.test/in-flight")
+    posted: list[dict] = []
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        started.set()
+        await release.wait()
+        posted.append(json.loads(request.content))
+        return httpx.Response(204)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    sink = DiscordWebhookSink(
+        max_retries=0,
+        timeout_sec=1,
+        log_payloads=False,
+        batch_window_sec=0.01,
+        client=client,
+    )
+
+    def health(status: str) -> DomainEvent:
+        return DomainEvent(
+            event_id=f"evt-{status}",
+            ts_ms=1_700_000_000_000,
+            event_type=EventType.HEALTH_EVENT,
+            metrics={"status": status},
+        )
+
+    await sink.publish(health("first"))
+    await asyncio.wait_for(started.wait(), timeout=5)
+    await sink.publish(health("second"))
+    closing = asyncio.create_task(sink.close())
+    await asyncio.sleep(0.05)
+    assert not closing.done()
+    release.set()
+    await asyncio.wait_for(closing, timeout=5)
+    await client.aclose()
+
+    values = [embed["fields"][0]["value"] for payload in posted for embed in payload["embeds"]]
+    assert values == ["first", "second"]
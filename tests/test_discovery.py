@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 from polymarket_monitor_engine.application.discovery import MarketDiscovery, resolve_tag_ids
@@ -269,3 +271,58 @@ async def test_market_discovery_filters_expired_markets() -> None:
     markets_by_category = results.markets_by_category
     assert [market.market_id for market in markets_by_category["geopolitics"]] == ["m2"]
     assert results.unsubscribable == []
+
+
+class SlowCatalog(FakeCatalog):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def list_markets(
+        self,
+        tag_id: str,
+        active: bool = True,
+        closed: bool = False,
+    ) -> list[Market]:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return await super().list_markets(tag_id, active, closed)
+
+
+@pytest.mark.asyncio
+async def test_market_discovery_fetches_tags_concurrently() -> None:
+    tags = [Tag(tag_id=str(i), slug=f"cat{i}", name=f"Cat{i}") for i in range(3)]
+    markets_by_tag = {
+        str(i): [Market(market_id=f"m{i}", question=f"Q{i}", liquidity=1)] for i in range(3)
+    }
+    catalog = SlowCatalog(tags=tags, markets_by_tag=markets_by_tag)
+    discovery = MarketDiscovery(
+        catalog=catalog,
+        clock=FakeClock(),
+        top_k_per_category=5,
+        hot_sort=["liquidity"],
+        min_liquidity=None,
+        focus_keywords=[],
+        keyword_allow=[],
+        keyword_block=[],
+        rolling_enabled=False,
+        primary_selection_priority=["liquidity"],
+        max_markets_per_topic=1,
+        top_enabled=False,
+        top_limit=10,
+        top_order=None,
+        top_ascending=False,
+        top_featured_only=False,
+        top_category_name="top",
+    )
+
+    results = await discovery.refresh(["cat2", "missing", "cat0", "cat1"])
+
+    assert catalog.max_in_flight == 3
+    assert list(results.markets_by_category) == ["cat2", "missing", "cat0", "cat1"]
+    assert results.markets_by_category["missing"] == []
+    assert [m.market_id for m in results.markets_by_category["cat2"]] == ["m2"]
+    assert results.markets_by_category["cat0"][0].category == "cat0"
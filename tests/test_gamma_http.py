@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+
 import httpx
 import pytest
 
-from polymarket_monitor_engine.adapters.gamma_http import GammaHttpCatalog
+from polymarket_monitor_engine.adapters import gamma_http
+from polymarket_monitor_engine.adapters.gamma_http import GammaHttpCatalog, _fast_iso_ms
 
 
 def test_parse_market_and_outcomes() -> None:
@@ -168,6 +171,7 @@ async def test_list_markets_events_limit_per_category() -> None:
         retry_max_attempts=1,
         events_limit_per_category=3,
         events_sort_primary=None,
+        page_concurrency=1,
     )
     catalog._client = client
 
@@ -442,3 +446,378 @@ async def test_list_top_markets_uses_events_params() -> None:
     assert seen_params.get("ascending") == "false"
     assert seen_params.get("limit") == "5"
     assert [market.market_id for market in markets] == ["m1"]
+
+
+@pytest.mark.asyncio
+async def test_catalogs_share_pooled_client_and_leave_injected_client_open() -> None:
+    kwargs = dict(
+        base_url="https://gamma.test",
+        timeout_sec=1,
+        page_size=2,
+        use_events_endpoint=True,
+        related_tags=False,
+        request_interval_ms=0,
+        tags_cache_sec=0,
+        retry_max_attempts=1,
+    )
+    first = GammaHttpCatalog(**kwargs)
+    second = GammaHttpCatalog(**kwargs)
+    assert first._client is second._client
+    await first.close()
+    await first.close()
+    assert not second._client.is_closed
+    await second.close()
+    assert second._client.is_closed
+    assert "https://gamma.test" not in gamma_http._shared_clients
+
+    injected = httpx.AsyncClient(base_url="https://gamma.test")
+    catalog = GammaHttpCatalog(**kwargs, client=injected)
+    await catalog.close()
+    assert not injected.is_closed
+    await injected.aclose()
+
+
+@pytest.mark.asyncio
+async def test_paginate_fetches_following_pages_concurrently() -> None:
+    seen_offsets: list[int] = []
+    total_items = 7
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params.get("offset", 0))
+        limit = int(request.url.params.get("limit", 2))
+        seen_offsets.append(offset)
+        items = [{"id": str(idx)} for idx in range(offset, min(offset + limit, total_items))]
+        return httpx.Response(200, json={"data": items})
+
+    client = httpx.AsyncClient(
+        base_url="https://example.com", transport=httpx.MockTransport(handler)
+    )
+    catalog = GammaHttpCatalog(
+        base_url="https://example.com",
+        timeout_sec=1,
+        page_size=2,
+        use_events_endpoint=True,
+        related_tags=False,
+        request_interval_ms=0,
+        tags_cache_sec=0,
+        retry_max_attempts=1,
+        page_concurrency=3,
+        client=client,
+    )
+
+    items = await catalog._paginate("/tags", {"limit": 2})
+    await client.aclose()
+
+    assert [item["id"] for item in items] == [str(idx) for idx in range(total_items)]
+    assert seen_offsets[0] == 0
+    assert sorted(seen_offsets) == [0, 2, 4, 6]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "2025-12-31T23:59:59Z",
+        "2025-12-31T12:00:00.123Z",
+        "2024-02-29T00:00:00.5Z",
+        "2025-06-01 08:30:00+00:00",
+    ],
+)
+def test_fast_iso_ms_matches_datetime(text: str) -> None:
+    from datetime import UTC, datetime
+
+    expected = datetime.fromisoformat(text.replace("Z", "+00:00")).astimezone(UTC)
+    assert _fast_iso_ms(text) == round(expected.timestamp() * 1000)
+    assert GammaHttpCatalog._parse_end_ts(text) == _fast_iso_ms(text)
+
+
+@pytest.mark.parametrize(
+    "text", ["2025-12-31", "2025-02-30T00:00:00Z", "2025-12-31T10:00:00+02:00"]
+)
+def test_fast_iso_ms_defers_to_datetime(text: str) -> None:
+    assert _fast_iso_ms(text) is None
+
+
+@pytest.mark.asyncio
+async def test_list_markets_reuses_cached_result_per_tag() -> None:
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        payload = {
+            "data": [
+                {
+                    "id": "e1",
+                    "title": "Event",
+                    "markets": [{"conditionId": "m1", "active": True, "closed": False}],
+                }
+            ]
+        }
+        return httpx.Response(200, json=payload)
+
+    client = httpx.AsyncClient(
+        base_url="https://example.com", transport=httpx.MockTransport(handler)
+    )
+    catalog = GammaHttpCatalog(
+        base_url="https://example.com",
+        timeout_sec=1,
+        page_size=2,
+        use_events_endpoint=True,
+        related_tags=False,
+        request_interval_ms=0,
+        tags_cache_sec=0,
+        retry_max_attempts=1,
+        events_sort_primary=None,
+        markets_cache_sec=60,
+        client=client,
+    )
+
+    first, second = await asyncio.gather(
+        catalog.list_markets(tag_id="tag-1"), catalog.list_markets(tag_id="tag-1")
+    )
+    first[0].category = "mutated"
+    third = await catalog.list_markets(tag_id="tag-1")
+    await client.aclose()
+
+    assert calls == 1
+    assert [m.market_id for m in first] == [m.market_id for m in second] == ["m1"]
+    assert first[0] is not second[0]
+    assert second[0].category is None
+    assert third[0].category is None
+    assert catalog._markets_inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_request_json_retries_retryable_status(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = {"count": 0}
+    sleeps: list[float] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["count"] += 1
+        if calls["count"] < 3:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"data": []})
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    client = httpx.AsyncClient(
+        base_url="https://example.com", transport=httpx.MockTransport(handler)
+    )
+    catalog = GammaHttpCatalog(
+        base_url="https://example.com",
+        timeout_sec=1,
+        page_size=2,
+        use_events_endpoint=False,
+        related_tags=False,
+        request_interval_ms=0,
+        tags_cache_sec=0,
+        retry_max_attempts=3,
+        client=client,
+    )
+
+    assert await catalog._request_json("/markets", {}) == {"data": []}
+    assert calls["count"] == 3
+    assert len(sleeps) == 2
+    assert 0 <= sleeps[0] <= 0.5 and 0 <= sleeps[1] <= 1.0
+
+    calls["count"] = -10
+    with pytest.raises(httpx.HTTPStatusError):
+        await catalog._request_json("/markets", {})
+    assert calls["count"] == -7
+    await client.aclose()
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ('["1", "2"]', ["1", "2"]),
+        ('[1, "", 2]', ["1", "2"]),
+        (["a", "b"], ["a", "b"]),
+        ([7, None, "c"], ["7", "c"]),
+        ("a, b", ["a", "b"]),
+        ("solo", ["solo"]),
+        (None, []),
+    ],
+)
+def test_parse_clob_token_ids_shapes(value: object, expected: list[str]) -> None:
+    assert GammaHttpCatalog._parse_clob_token_ids(value) == expected
+
+
+@pytest.mark.asyncio
+async def test_list_tags_coalesces_concurrent_misses() -> None:
+    calls = {"count": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls["count"] += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"data": [{"id": "1", "slug": "finance"}]})
+
+    client = httpx.AsyncClient(
+        base_url="https://example.com", transport=httpx.MockTransport(handler)
+    )
+    catalog = GammaHttpCatalog(
+        base_url="https://example.com",
+        timeout_sec=1,
+        page_size=10,
+        use_events_endpoint=False,
+        related_tags=False,
+        request_interval_ms=0,
+        tags_cache_sec=60,
+        retry_max_attempts=1,
+        client=client,
+    )
+
+    first, second = await asyncio.gather(catalog.list_tags(), catalog.list_tags())
+    await client.aclose()
+
+    assert calls["count"] == 1
+    assert first is second
+    assert [tag.tag_id for tag in first] == ["1"]
+
+
+@pytest.mark.asyncio
+async def test_list_tags_cache_expires() -> None:
+    calls = {"count": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["count"] += 1
+        return httpx.Response(200, json={"data": [{"id": str(calls["count"])}]})
+
+    client = httpx.AsyncClient(
+        base_url="https://example.com", transport=httpx.MockTransport(handler)
+    )
+    catalog = GammaHttpCatalog(
+        base_url="https://example.com",
+        timeout_sec=1,
+        page_size=10,
+        use_events_endpoint=False,
+        related_tags=False,
+        request_interval_ms=0,
+        tags_cache_sec=60,
+        retry_max_attempts=1,
+        client=client,
+    )
+
+    assert [tag.tag_id for tag in await catalog.list_tags()] == ["1"]
+    assert [tag.tag_id for tag in await catalog.list_tags()] == ["1"]
+    assert catalog._tags_cache is not None
+    catalog._tags_cache = (0.0, catalog._tags_cache[1])
+    assert [tag.tag_id for tag in await catalog.list_tags()] == ["2"]
+    await client.aclose()
+
+
+def test_extract_markets_from_event_inherits_without_mutating() -> None:
+    item = {"conditionId": "m1", "question": "", "active": True}
+    event = {
+        "id": 42,
+        "title": "Event Title",
+        "endDate": "2024-01-01T00:00:00Z",
+        "enableOrderBook": True,
+        "markets": [item, {"conditionId": "m2", "eventId": "own", "endDate": None}],
+    }
+
+    first, second = GammaHttpCatalog._extract_markets_from_event(event)
+
+    assert item == {"conditionId": "m1", "question": "", "active": True}
+    assert first.event_id == "42"
+    assert first.question == "Event Title"
+    assert first.end_ts == 1_704_067_200_000
+    assert first.enable_orderbook is True
+    assert second.event_id == "own"
+    assert second.end_ts is None
+
+
+class FakeTagsStore:
+    def __init__(self) -> None:
+        self.data: dict[str, bytes] = {}
+        self.ttls: dict[str, int] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: bytes, ex: int | None = None) -> None:
+        self.data[key] = value
+        self.ttls[key] = ex
+
+
+@pytest.mark.asyncio
+async def test_list_tags_shares_redis_store_across_catalogs() -> None:
+    calls = {"count": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["count"] += 1
+        return httpx.Response(200, json={"data": [{"id": "1", "slug": "finance"}]})
+
+    client = httpx.AsyncClient(
+        base_url="https://example.com", transport=httpx.MockTransport(handler)
+    )
+    store = FakeTagsStore()
+    kwargs = dict(
+        base_url="https://example.com",
+        timeout_sec=1,
+        page_size=10,
+        use_events_endpoint=False,
+        related_tags=False,
+        request_interval_ms=0,
+        tags_cache_sec=600,
+        retry_max_attempts=1,
+        client=client,
+        tags_store=store,
+    )
+
+    first = await GammaHttpCatalog(**kwargs).list_tags()
+    second = await GammaHttpCatalog(**kwargs).list_tags()
+    await client.aclose()
+
+    assert calls["count"] == 1
+    assert store.ttls == {"gamma:tags:v1:https://example.com": 600}
+    assert [(tag.tag_id, tag.slug) for tag in second] == [("1", "finance")]
+    assert second == first
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_events", [True, False])
+async def test_list_markets_offloads_large_parses(
+    monkeypatch: pytest.MonkeyPatch, use_events: bool
+) -> None:
+    offloaded: list[str] = []
+    real_to_thread = asyncio.to_thread
+
+    async def spy_to_thread(func, *args):
+        offloaded.append(func.__name__)
+        return await real_to_thread(func, *args)
+
+    monkeypatch.setattr(gamma_http, "_PARSE_OFFLOAD_THRESHOLD", 1)
+    monkeypatch.setattr(asyncio, "to_thread", spy_to_thread)
+    markets_raw = [{"conditionId": "m1", "question": "A"}, {"conditionId": "m2", "question": "B"}]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/events":
+            data = [{"id": f"e{i}", "markets": [item]} for i, item in enumerate(markets_raw)]
+        else:
+            data = markets_raw
+        return httpx.Response(200, json={"data": data})
+
+    client = httpx.AsyncClient(
+        base_url="https://example.com", transport=httpx.MockTransport(handler)
+    )
+    catalog = GammaHttpCatalog(
+        base_url="https://example.com",
+        timeout_sec=1,
+        page_size=10,
+        use_events_endpoint=use_events,
+        related_tags=False,
+        request_interval_ms=0,
+        tags_cache_sec=0,
+        retry_max_attempts=1,
+        markets_cache_sec=0,
+        client=client,
+    )
+
+    markets = await catalog.list_markets(tag_id="tag-1")
+    await client.aclose()
+
+    assert [market.market_id for market in markets] == ["m1", "m2"]
+    assert offloaded == ["_markets_from_events" if use_events else "_markets_from_items"]
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 
-from polymarket_monitor_engine.util.logging_setup import resolve_log_path
+import orjson
+
+from polymarket_monitor_engine.util.logging_setup import _orjson_dumps, resolve_log_path
 
 
 def test_resolve_log_path_inserts_timestamp() -> None:
@@ -20,3 +22,11 @@ def test_resolve_log_path_template_supports_ts() -> None:
 def test_resolve_log_path_none_returns_none() -> None:
     fixed = datetime(2026, 2, 3, 1, 2, 3, tzinfo=UTC)
     assert resolve_log_path(None, now=fixed) is None
+
+
+def test_orjson_dumps_inlines_fragments_and_falls_back_to_repr() -> None:
+    rendered = _orjson_dumps(
+        {"event": "domain_event", "payload": orjson.Fragment(b'{"a":1}'), 1: {1}},
+        default=repr,
+    )
+    assert orjson.loads(rendered) == {"event": "domain_event", "payload": {"a": 1}, "1": "{1}"}
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 from polymarket_monitor_engine.adapters.multiplex_sink import MultiplexEventSink
@@ -73,3 +75,26 @@ async def test_compact_transform_drops_raw() -> None:
     mux = MultiplexEventSink(sinks={"s": sink}, transform="compact")
     await mux.publish(_sample_event(EventType.CANDIDATE_SELECTED))
     assert sink.events[0].raw is None
+
+
+@pytest.mark.asyncio
+async def test_publish_fans_out_concurrently_and_isolates_failures() -> None:
+    release = asyncio.Event()
+    fast = CaptureSink()
+
+    class BlockedSink(CaptureSink):
+        async def publish(self, event: DomainEvent) -> None:
+            await release.wait()
+            await super().publish(event)
+
+    blocked = BlockedSink()
+    mux = MultiplexEventSink(sinks={"blocked": blocked, "bad": FailingSink(), "fast": fast})
+
+    publishing = asyncio.create_task(mux.publish(_sample_event()))
+    await asyncio.sleep(0.01)
+    assert len(fast.events) == 1
+    assert not blocked.events
+    release.set()
+    await publishing
+
+    assert len(blocked.events) == 1
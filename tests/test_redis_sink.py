@@ -1,25 +1,57 @@
 from __future__ import annotations
 
+import asyncio
+
+import orjson
 import pytest
 
 from polymarket_monitor_engine.adapters import redis_sink
 from polymarket_monitor_engine.domain.events import DomainEvent, EventType
 
 
+class FakePipeline:
+    def __init__(self, redis: FakeRedis) -> None:
+        self._redis = redis
+        self._buffered = []
+
+    async def __aenter__(self) -> FakePipeline:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+    def publish(self, channel: str, payload: bytes) -> FakePipeline:
+        self._buffered.append((channel, payload))
+        return self
+
+    async def execute(self) -> list[int]:
+        self._redis.executions += 1
+        if self._redis.delay:
+            await asyncio.sleep(self._redis.delay)
+        if self._redis.fail:
+            raise ConnectionError("redis down")
+        self._redis.published.extend(self._buffered)
+        return [1] * len(self._buffered)
+
+
 class FakeRedis:
     def __init__(self) -> None:
         self.published = []
+        self.executions = 0
         self.closed = False
+        self.fail = False
+        self.delay = 0.0
 
-    async def publish(self, channel: str, payload: bytes) -> None:
-        self.published.append((channel, payload))
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        assert transaction is False
+        return FakePipeline(self)
 
     async def close(self) -> None:
         self.closed = True
 
 
-def _event() -> DomainEvent:
-    return DomainEvent(event_id="evt-1", ts_ms=1, event_type=EventType.HEALTH_EVENT)
+def _event(event_id: str = "evt-1") -> DomainEvent:
+    return DomainEvent(event_id=event_id, ts_ms=1, event_type=EventType.HEALTH_EVENT)
 
 
 @pytest.mark.asyncio
@@ -33,4 +65,69 @@ async def test_redis_sink_publishes(monkeypatch) -> None:
 
     assert fake.published
     assert fake.published[0][0] == "chan"
+    assert fake.published[0][1] == orjson.dumps(_event().model_dump())
+    assert fake.closed is True
+
+
+@pytest.mark.asyncio
+async def test_redis_sink_pipelines_queued_events(monkeypatch) -> None:
+    fake = FakeRedis()
+    monkeypatch.setattr(redis_sink.redis, "from_url", lambda *args, **kwargs: fake)
+
+    sink = redis_sink.RedisPubSubSink(url="redis://localhost:6379/0", channel="chan")
+    for idx in range(3):
+        await sink.publish(_event(f"evt-{idx}"))
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+    assert fake.executions == 1
+    assert [orjson.loads(payload)["event_id"] for _, payload in fake.published] == [
+        "evt-0",
+        "evt-1",
+        "evt-2",
+    ]
+
+    await sink.publish(_event("evt-3"))
+    await sink.close()
+
+    assert fake.executions == 2
+    assert orjson.loads(fake.published[-1][1])["event_id"] == "evt-3"
+
+
+@pytest.mark.asyncio
+async def test_redis_sink_reports_background_failures(monkeypatch) -> None:
+    fake = FakeRedis()
+    fake.fail = True
+    monkeypatch.setattr(redis_sink.redis, "from_url", lambda *args, **kwargs: fake)
+
+    sink = redis_sink.RedisPubSubSink(url="redis://localhost:6379/0", channel="chan")
+    await sink.publish(_event("evt-0"))
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+    with pytest.raises(RuntimeError, match="1 events") as excinfo:
+        await sink.publish(_event("evt-1"))
+    assert isinstance(excinfo.value.__cause__, ConnectionError)
+
+    fake.fail = False
+    await sink.close()
+    assert [orjson.loads(payload)["event_id"] for _, payload in fake.published] == ["evt-1"]
+
+
+@pytest.mark.asyncio
+async def test_redis_sink_close_waits_for_in_flight_batch(monkeypatch) -> None:
+    fake = FakeRedis()
+    fake.delay = 0.01
+    monkeypatch.setattr(redis_sink.redis, "from_url", lambda *args, **kwargs: fake)
+
+    sink = redis_sink.RedisPubSubSink(url="redis://localhost:6379/0", channel="chan")
+    await sink.publish(_event("evt-0"))
+    await asyncio.sleep(0)
+    await sink.publish(_event("evt-1"))
+    await sink.close()
+
+    assert [orjson.loads(payload)["event_id"] for _, payload in fake.published] == [
+        "evt-0",
+        "evt-1",
+    ]
     assert fake.closed is True